@@ -0,0 +1,286 @@
+import cv2
+import numpy as np
+import random
+import os
+import time
+
+# Constants
+WIDTH, HEIGHT = 1920, 1080
+LINE_COLOR = (0, 0, 0)
+LINE_THICKNESS = 5
+O_COLOR = (255, 0, 0)
+X_COLOR = (0, 0, 255)
+STRIKE_THICKNESS = 10
+FONT = cv2.FONT_HERSHEY_SIMPLEX
+DRAW_FPS = 60  # Frames per second
+ANIMATION_FRAMES = 5  # Number of frames for each drawing animation
+VIDEO_DURATION = 60 * 60  # Duration of the video in seconds
+TOTAL_FRAMES = VIDEO_DURATION * DRAW_FPS  # Total frames for the video
+
+# Ensure render directory exists
+if not os.path.exists('render'):
+    os.makedirs('render')
+
+# Get epoch time for filename
+epoch_time = int(time.time())
+filename = f'render/tic_tac_toe_animated_{epoch_time}.mp4'
+
+
+def calculate_margins_and_cell_size(SIZE):
+    max_cell_size = min(WIDTH, HEIGHT) // SIZE - LINE_THICKNESS
+    margin_x = (WIDTH - (max_cell_size * SIZE)) // 2
+    margin_y = (HEIGHT - (max_cell_size * SIZE)) // 2
+    return margin_x, margin_y, max_cell_size
+
+
+def draw_board(frame, board, margin_x, margin_y, CELL_SIZE, used_cells):
+    SIZE = len(board)
+    for i in range(1, SIZE):
+        # Horizontal lines
+        cv2.line(frame, (margin_x, margin_y + i * CELL_SIZE),
+                 (margin_x + CELL_SIZE * SIZE, margin_y + i * CELL_SIZE), LINE_COLOR, LINE_THICKNESS)
+        # Vertical lines
+        cv2.line(frame, (margin_x + i * CELL_SIZE, margin_y),
+                 (margin_x + i * CELL_SIZE, margin_y + CELL_SIZE * SIZE), LINE_COLOR, LINE_THICKNESS)
+
+    for row in range(SIZE):
+        for col in range(SIZE):
+            center = (margin_x + col * CELL_SIZE + CELL_SIZE // 2,
+                      margin_y + row * CELL_SIZE + CELL_SIZE // 2)
+            if board[row][col] == 'O':
+                cv2.circle(frame, center, CELL_SIZE // 3, O_COLOR, LINE_THICKNESS)
+            elif board[row][col] == 'X':
+                cv2.line(frame, (center[0] - CELL_SIZE // 4, center[1] - CELL_SIZE // 4),
+                         (center[0] + CELL_SIZE // 4, center[1] + CELL_SIZE // 4), X_COLOR, LINE_THICKNESS)
+                cv2.line(frame, (center[0] + CELL_SIZE // 4, center[1] - CELL_SIZE // 4),
+                         (center[0] - CELL_SIZE // 4, center[1] + CELL_SIZE // 4), X_COLOR, LINE_THICKNESS)
+            if used_cells[row][col]:
+                cv2.rectangle(frame, (margin_x + col * CELL_SIZE, margin_y + row * CELL_SIZE),
+                              (margin_x + (col + 1) * CELL_SIZE, margin_y + (row + 1) * CELL_SIZE),
+                              (0, 255, 0), 3)
+
+
+def animate_O(frame, center, CELL_SIZE):
+    for i in range(ANIMATION_FRAMES):
+        angle = int(360 * i / ANIMATION_FRAMES)
+        axes = (CELL_SIZE // 3, CELL_SIZE // 3)
+        cv2.ellipse(frame, center, axes, 0, 0, angle, O_COLOR, LINE_THICKNESS)
+        yield frame.copy()
+
+
+def animate_X(frame, center, CELL_SIZE):
+    line_step = CELL_SIZE // (4 * ANIMATION_FRAMES)
+    # Draw the first diagonal
+    for i in range(ANIMATION_FRAMES):
+        cv2.line(frame, (center[0] - line_step * i, center[1] - line_step * i),
+                 (center[0] - CELL_SIZE // 4, center[1] - CELL_SIZE // 4), X_COLOR, LINE_THICKNESS)
+        cv2.line(frame, (center[0] + CELL_SIZE // 4, center[1] + CELL_SIZE // 4),
+                 (center[0] + line_step * i, center[1] + line_step * i), X_COLOR, LINE_THICKNESS)
+        yield frame.copy()
+    # Draw the second diagonal
+    for i in range(ANIMATION_FRAMES):
+        cv2.line(frame, (center[0] + line_step * i, center[1] - line_step * i),
+                 (center[0] + CELL_SIZE // 4, center[1] - CELL_SIZE // 4), X_COLOR, LINE_THICKNESS)
+        cv2.line(frame, (center[0] - CELL_SIZE // 4, center[1] + CELL_SIZE // 4),
+                 (center[0] - line_step * i, center[1] + line_step * i), X_COLOR, LINE_THICKNESS)
+        yield frame.copy()
+
+
+def check_winner(board, used_cells, last_move):
+    # Only the 3-cell windows that contain the last placed piece can have been completed by it
+    if last_move is None:
+        return None, None
+    SIZE = len(board)
+    r, c = last_move
+    player = board[r][c]
+    if player == '' or used_cells[r][c]:
+        return None, None
+
+    # Check the row through the last move
+    for j in range(max(0, c - 2), min(c, SIZE - 3) + 1):
+        if board[r][j] == board[r][j+1] == board[r][j+2] == player:
+            if not used_cells[r][j] and not used_cells[r][j+1] and not used_cells[r][j+2]:
+                return player, ('row', r, j)
+
+    # Check the column through the last move
+    for j in range(max(0, r - 2), min(r, SIZE - 3) + 1):
+        if board[j][c] == board[j+1][c] == board[j+2][c] == player:
+            if not used_cells[j][c] and not used_cells[j+1][c] and not used_cells[j+2][c]:
+                return player, ('col', c, j)
+
+    # Check the main diagonal, if the last move lies on it
+    if r == c:
+        for i in range(max(0, r - 2), min(r, SIZE - 3) + 1):
+            if board[i][i] == board[i+1][i+1] == board[i+2][i+2] == player:
+                if not used_cells[i][i] and not used_cells[i+1][i+1] and not used_cells[i+2][i+2]:
+                    return player, ('diag', i)
+
+    # Check the anti-diagonal, if the last move lies on it
+    if r + c == SIZE - 1:
+        for i in range(max(0, r - 2), min(r, SIZE - 3) + 1):
+            if board[i][SIZE-i-1] == board[i+1][SIZE-i-2] == board[i+2][SIZE-i-3] == player:
+                if not used_cells[i][SIZE-i-1] and not used_cells[i+1][SIZE-i-2] and not used_cells[i+2][SIZE-i-3]:
+                    return player, ('anti_diag', i)
+
+    return None, None
+
+
+def draw_strike_line(frame, margin_x, margin_y, CELL_SIZE, SIZE, win_info, color, used_cells):
+    if win_info[0] == 'row':
+        _, row, col_start = win_info
+        start_point = (margin_x + col_start * CELL_SIZE, margin_y + row * CELL_SIZE + CELL_SIZE // 2)
+        end_point = (margin_x + (col_start + 3) * CELL_SIZE, margin_y + row * CELL_SIZE + CELL_SIZE // 2)
+        used_cells[row][col_start] = used_cells[row][col_start+1] = used_cells[row][col_start+2] = True
+    elif win_info[0] == 'col':
+        _, col, row_start = win_info
+        start_point = (margin_x + col * CELL_SIZE + CELL_SIZE // 2, margin_y + row_start * CELL_SIZE)
+        end_point = (margin_x + col * CELL_SIZE + CELL_SIZE // 2, margin_y + (row_start + 3) * CELL_SIZE)
+        used_cells[row_start][col] = used_cells[row_start+1][col] = used_cells[row_start+2][col] = True
+    elif win_info[0] == 'diag':
+        _, start_idx = win_info
+        start_point = (margin_x + start_idx * CELL_SIZE, margin_y + start_idx * CELL_SIZE)
+        end_point = (margin_x + (start_idx + 3) * CELL_SIZE, margin_y + (start_idx + 3) * CELL_SIZE)
+        used_cells[start_idx][start_idx] = used_cells[start_idx+1][start_idx+1] = used_cells[start_idx+2][start_idx+2] = True
+    elif win_info[0] == 'anti_diag':
+        _, start_idx = win_info
+        start_point = (margin_x + (SIZE - start_idx - 1) * CELL_SIZE, margin_y + start_idx * CELL_SIZE)
+        end_point = (margin_x + (SIZE - start_idx - 4) * CELL_SIZE, margin_y + (start_idx + 3) * CELL_SIZE)
+        used_cells[start_idx][SIZE-start_idx-1] = used_cells[start_idx+1][SIZE-start_idx-2] = used_cells[start_idx+2][SIZE-start_idx-3] = True
+
+    cv2.line(frame, start_point, end_point, color, STRIKE_THICKNESS)
+
+
+def random_move(board, player, opponent, used_cells):
+    empty_cells = [(r, c) for r in range(len(board)) for c in range(len(board)) if board[r][c] == '' and not used_cells[r][c]]
+    if not empty_cells:
+        return None, None
+
+    # Check if player can win
+    for r, c in empty_cells:
+        board[r][c] = player
+        if check_winner(board, used_cells, (r, c))[0] == player:
+            return r, c
+        board[r][c] = ''
+
+    # Check if opponent can win and block
+    for r, c in empty_cells:
+        board[r][c] = opponent
+        if check_winner(board, used_cells, (r, c))[0] == opponent:
+            board[r][c] = player
+            return r, c
+        board[r][c] = ''
+
+    # No immediate win or block, choose random
+    return random.choice(empty_cells)
+
+
+def draw_text_with_capsule(frame, text, font, font_scale, thickness, position, text_color, capsule_color, capsule_padding=20):
+    text_size = cv2.getTextSize(text, font, font_scale, thickness)[0]
+    text_x, text_y = position
+
+    # Calculate capsule dimensions
+    capsule_width = text_size[0] + capsule_padding * 2
+    capsule_height = text_size[1] + capsule_padding * 2
+    capsule_top_left = (text_x - capsule_padding, text_y - text_size[1] - capsule_padding)
+    capsule_bottom_right = (text_x + text_size[0] + capsule_padding, text_y + capsule_padding)
+
+    # Draw the capsule (rounded rectangle)
+    radius = int(capsule_height / 2)
+    cv2.rectangle(frame, capsule_top_left, capsule_bottom_right, capsule_color, -1, lineType=cv2.LINE_AA)
+    cv2.circle(frame, (capsule_top_left[0] + radius, capsule_top_left[1] + radius), radius, capsule_color, -1, lineType=cv2.LINE_AA)
+    cv2.circle(frame, (capsule_bottom_right[0] - radius, capsule_top_left[1] + radius), radius, capsule_color, -1, lineType=cv2.LINE_AA)
+
+    # Draw the text
+    cv2.putText(frame, text, position, font, font_scale, text_color, thickness, cv2.LINE_AA)
+
+
+def main():
+    SIZE = random.randint(15, 20)  # Randomize the size of the board at the start
+    margin_x, margin_y, CELL_SIZE = calculate_margins_and_cell_size(SIZE)
+    board = [['' for _ in range(SIZE)] for _ in range(SIZE)]
+    used_cells = [[False for _ in range(SIZE)] for _ in range(SIZE)]
+
+    frame = np.ones((HEIGHT, WIDTH, 3), dtype=np.uint8) * 255
+    players = ['O', 'X']
+    current_player_index = 0
+    last_move = None
+
+    score = {'O': 0, 'X': 0}
+
+    out = cv2.VideoWriter(filename, cv2.VideoWriter_fourcc(*'mp4v'), DRAW_FPS, (WIDTH, HEIGHT))
+
+    frame_count = 0
+
+    while frame_count < TOTAL_FRAMES:
+        draw_board(frame, board, margin_x, margin_y, CELL_SIZE, used_cells)
+        out.write(frame)
+        frame_count += 1
+
+        winner, win_info = check_winner(board, used_cells, last_move)
+        if winner:
+            color = O_COLOR if winner == 'O' else X_COLOR
+            draw_strike_line(frame, margin_x, margin_y, CELL_SIZE, SIZE, win_info, color, used_cells)
+
+            score[winner] += 1  # Increment score
+
+            for _ in range(DRAW_FPS):  # Pause briefly to show the strike
+                if frame_count >= TOTAL_FRAMES:
+                    break
+                out.write(frame)
+                frame_count += 1
+
+        player = players[current_player_index]
+        opponent = players[(current_player_index + 1) % 2]
+
+        row, col = random_move(board, player, opponent, used_cells)
+        if row is not None and col is not None:
+            # Ensure the move is placed on an empty cell
+            if board[row][col] == '':
+                center = (margin_x + col * CELL_SIZE + CELL_SIZE // 2,
+                          margin_y + row * CELL_SIZE + CELL_SIZE // 2)
+                if player == 'O':
+                    for frame in animate_O(frame.copy(), center, CELL_SIZE):
+                        if frame_count >= TOTAL_FRAMES:
+                            break
+                        out.write(frame)
+                        frame_count += 1
+                else:
+                    for frame in animate_X(frame.copy(), center, CELL_SIZE):
+                        if frame_count >= TOTAL_FRAMES:
+                            break
+                        out.write(frame)
+                        frame_count += 1
+
+                board[row][col] = player
+            last_move = (row, col)
+
+        if frame_count >= TOTAL_FRAMES:
+            break
+
+        current_player_index = (current_player_index + 1) % 2
+
+        # Check if the board is full and restart
+        if all([cell != '' or used_cells[r][c] for r, row in enumerate(board) for c, cell in enumerate(row)]):
+            text = f"Game Over! O: {score['O']} - X: {score['X']}"
+            draw_text_with_capsule(frame, text, FONT, 1.5, 3, ((WIDTH - cv2.getTextSize(text, FONT, 1.5, 3)[0][0]) // 2,
+                                                              (HEIGHT + cv2.getTextSize(text, FONT, 1.5, 3)[0][1]) // 2), LINE_COLOR, (255, 255, 255))
+            for _ in range(DRAW_FPS * 2):  # Pause to show the final score
+                if frame_count >= TOTAL_FRAMES:
+                    break
+                out.write(frame)
+                frame_count += 1
+
+            # Reset the board
+            board = [['' for _ in range(SIZE)] for _ in range(SIZE)]
+            used_cells = [[False for _ in range(SIZE)] for _ in range(SIZE)]
+            frame = np.ones((HEIGHT, WIDTH, 3), dtype=np.uint8) * 255  # Clear frame
+            score = {'O': 0, 'X': 0}  # Reset the score
+            current_player_index = 0
+            last_move = None
+
+    out.release()
+    cv2.destroyAllWindows()
+
+
+if __name__ == "__main__":
+    main()
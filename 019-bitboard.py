@@ -0,0 +1,328 @@
+import cv2
+import numpy as np
+import random
+import os
+import time
+
+# Constants
+WIDTH, HEIGHT = 1920, 1080
+LINE_COLOR = (0, 0, 0)
+LINE_THICKNESS = 5
+O_COLOR = (255, 0, 0)
+X_COLOR = (0, 0, 255)
+STRIKE_THICKNESS = 10
+FONT = cv2.FONT_HERSHEY_SIMPLEX
+DRAW_FPS = 60  # Frames per second
+ANIMATION_FRAMES = 5  # Number of frames for each drawing animation
+VIDEO_DURATION = 60 * 60  # Duration of the video in seconds
+TOTAL_FRAMES = VIDEO_DURATION * DRAW_FPS  # Total frames for the video
+
+# Ensure render directory exists
+if not os.path.exists('render'):
+    os.makedirs('render')
+
+# Get epoch time for filename
+epoch_time = int(time.time())
+filename = f'render/tic_tac_toe_animated_{epoch_time}.mp4'
+
+
+def calculate_margins_and_cell_size(SIZE):
+    max_cell_size = min(WIDTH, HEIGHT) // SIZE - LINE_THICKNESS
+    margin_x = (WIDTH - (max_cell_size * SIZE)) // 2
+    margin_y = (HEIGHT - (max_cell_size * SIZE)) // 2
+    return margin_x, margin_y, max_cell_size
+
+
+# Bitboards: cell (row, col) is bit row * (SIZE + 1) + col. The extra column on
+# every row is always empty, so shifting a board never wraps from one row into the next.
+def new_board(SIZE):
+    stride = SIZE + 1
+    full_mask = diag_mask = anti_diag_mask = 0
+    for r in range(SIZE):
+        for c in range(SIZE):
+            bit = 1 << (r * stride + c)
+            full_mask |= bit
+            if r == c:
+                diag_mask |= bit
+            if r + c == SIZE - 1:
+                anti_diag_mask |= bit
+    # Shift and mask for every direction, in the order check_winner looks at them
+    directions = [('row', 1, full_mask), ('col', stride, full_mask),
+                  ('diag', stride + 1, diag_mask), ('anti_diag', stride - 1, anti_diag_mask)]
+    return {'size': SIZE, 'O': 0, 'X': 0, 'full': full_mask, 'directions': directions}
+
+
+def cell_bit(board, row, col):
+    return 1 << (row * (board['size'] + 1) + col)
+
+
+def is_occupied(board, row, col):
+    return bool((board['O'] | board['X']) & cell_bit(board, row, col))
+
+
+def legal_moves(board, used_cells):
+    return board['full'] & ~(board['O'] | board['X'] | used_cells)
+
+
+def bit_to_cell(board, bit):
+    return divmod(bit.bit_length() - 1, board['size'] + 1)
+
+
+def nth_set_bit(bits, n):
+    for _ in range(n):
+        bits &= bits - 1  # Drop the lowest set bit
+    return bits & -bits
+
+
+def draw_board(frame, board, margin_x, margin_y, CELL_SIZE, used_cells):
+    SIZE = board['size']
+    for i in range(1, SIZE):
+        # Horizontal lines
+        cv2.line(frame, (margin_x, margin_y + i * CELL_SIZE),
+                 (margin_x + CELL_SIZE * SIZE, margin_y + i * CELL_SIZE), LINE_COLOR, LINE_THICKNESS)
+        # Vertical lines
+        cv2.line(frame, (margin_x + i * CELL_SIZE, margin_y),
+                 (margin_x + i * CELL_SIZE, margin_y + CELL_SIZE * SIZE), LINE_COLOR, LINE_THICKNESS)
+
+    for row in range(SIZE):
+        for col in range(SIZE):
+            center = (margin_x + col * CELL_SIZE + CELL_SIZE // 2,
+                      margin_y + row * CELL_SIZE + CELL_SIZE // 2)
+            bit = cell_bit(board, row, col)
+            if board['O'] & bit:
+                cv2.circle(frame, center, CELL_SIZE // 3, O_COLOR, LINE_THICKNESS)
+            elif board['X'] & bit:
+                cv2.line(frame, (center[0] - CELL_SIZE // 4, center[1] - CELL_SIZE // 4),
+                         (center[0] + CELL_SIZE // 4, center[1] + CELL_SIZE // 4), X_COLOR, LINE_THICKNESS)
+                cv2.line(frame, (center[0] + CELL_SIZE // 4, center[1] - CELL_SIZE // 4),
+                         (center[0] - CELL_SIZE // 4, center[1] + CELL_SIZE // 4), X_COLOR, LINE_THICKNESS)
+            if used_cells & bit:
+                cv2.rectangle(frame, (margin_x + col * CELL_SIZE, margin_y + row * CELL_SIZE),
+                              (margin_x + (col + 1) * CELL_SIZE, margin_y + (row + 1) * CELL_SIZE),
+                              (0, 255, 0), 3)
+
+
+def animate_O(frame, center, CELL_SIZE):
+    for i in range(ANIMATION_FRAMES):
+        angle = int(360 * i / ANIMATION_FRAMES)
+        axes = (CELL_SIZE // 3, CELL_SIZE // 3)
+        cv2.ellipse(frame, center, axes, 0, 0, angle, O_COLOR, LINE_THICKNESS)
+        yield frame.copy()
+
+
+def animate_X(frame, center, CELL_SIZE):
+    line_step = CELL_SIZE // (4 * ANIMATION_FRAMES)
+    # Draw the first diagonal
+    for i in range(ANIMATION_FRAMES):
+        cv2.line(frame, (center[0] - line_step * i, center[1] - line_step * i),
+                 (center[0] - CELL_SIZE // 4, center[1] - CELL_SIZE // 4), X_COLOR, LINE_THICKNESS)
+        cv2.line(frame, (center[0] + CELL_SIZE // 4, center[1] + CELL_SIZE // 4),
+                 (center[0] + line_step * i, center[1] + line_step * i), X_COLOR, LINE_THICKNESS)
+        yield frame.copy()
+    # Draw the second diagonal
+    for i in range(ANIMATION_FRAMES):
+        cv2.line(frame, (center[0] + line_step * i, center[1] - line_step * i),
+                 (center[0] + CELL_SIZE // 4, center[1] - CELL_SIZE // 4), X_COLOR, LINE_THICKNESS)
+        cv2.line(frame, (center[0] - CELL_SIZE // 4, center[1] + CELL_SIZE // 4),
+                 (center[0] - line_step * i, center[1] + line_step * i), X_COLOR, LINE_THICKNESS)
+        yield frame.copy()
+
+
+def check_winner(board, used_cells, last_move):
+    # Only the 3-cell windows that contain the last placed piece can have been completed by it
+    if last_move is None:
+        return None, None
+    bit = cell_bit(board, *last_move)
+    if used_cells & bit:
+        return None, None
+    player = 'O' if board['O'] & bit else 'X' if board['X'] & bit else None
+    if player is None:
+        return None, None
+
+    free = board[player] & ~used_cells
+    for kind, d, mask in board['directions']:
+        if not bit & mask:
+            continue
+        pieces = free & mask
+        # Bits where a window of three starts, limited to the windows through the last move
+        starts = pieces & (pieces >> d) & (pieces >> 2 * d) & (bit | bit >> d | bit >> 2 * d)
+        if starts:
+            r, c = bit_to_cell(board, starts & -starts)
+            if kind == 'row':
+                return player, ('row', r, c)
+            elif kind == 'col':
+                return player, ('col', c, r)
+            else:
+                return player, (kind, r)
+
+    return None, None
+
+
+def winning_cells(board, player, used_cells):
+    # Every legal cell that would complete three in a row for player
+    legal = legal_moves(board, used_cells)
+    free = board[player] & ~used_cells
+    wins = 0
+    for _, d, mask in board['directions']:
+        pieces = free & mask
+        # The empty cell can be the first, the middle or the last of the window
+        wins |= ((pieces >> d) & (pieces >> 2 * d)) | ((pieces << d) & (pieces >> d)) | ((pieces << d) & (pieces << 2 * d))
+    return wins & legal
+
+
+def draw_strike_line(frame, margin_x, margin_y, CELL_SIZE, SIZE, win_info, color, used_cells):
+    stride = SIZE + 1
+    if win_info[0] == 'row':
+        _, row, col_start = win_info
+        start_point = (margin_x + col_start * CELL_SIZE, margin_y + row * CELL_SIZE + CELL_SIZE // 2)
+        end_point = (margin_x + (col_start + 3) * CELL_SIZE, margin_y + row * CELL_SIZE + CELL_SIZE // 2)
+        used_cells |= 0b111 << (row * stride + col_start)
+    elif win_info[0] == 'col':
+        _, col, row_start = win_info
+        start_point = (margin_x + col * CELL_SIZE + CELL_SIZE // 2, margin_y + row_start * CELL_SIZE)
+        end_point = (margin_x + col * CELL_SIZE + CELL_SIZE // 2, margin_y + (row_start + 3) * CELL_SIZE)
+        used_cells |= (1 | 1 << stride | 1 << 2 * stride) << (row_start * stride + col)
+    elif win_info[0] == 'diag':
+        _, start_idx = win_info
+        start_point = (margin_x + start_idx * CELL_SIZE, margin_y + start_idx * CELL_SIZE)
+        end_point = (margin_x + (start_idx + 3) * CELL_SIZE, margin_y + (start_idx + 3) * CELL_SIZE)
+        used_cells |= (1 | 1 << (stride + 1) | 1 << 2 * (stride + 1)) << (start_idx * stride + start_idx)
+    elif win_info[0] == 'anti_diag':
+        _, start_idx = win_info
+        start_point = (margin_x + (SIZE - start_idx - 1) * CELL_SIZE, margin_y + start_idx * CELL_SIZE)
+        end_point = (margin_x + (SIZE - start_idx - 4) * CELL_SIZE, margin_y + (start_idx + 3) * CELL_SIZE)
+        used_cells |= (1 | 1 << (stride - 1) | 1 << 2 * (stride - 1)) << (start_idx * stride + SIZE - start_idx - 1)
+
+    cv2.line(frame, start_point, end_point, color, STRIKE_THICKNESS)
+    return used_cells
+
+
+def random_move(board, player, opponent, used_cells):
+    legal = legal_moves(board, used_cells)
+    if not legal:
+        return None, None
+
+    # Check if player can win (lowest bit first, same order as scanning the board row by row)
+    wins = winning_cells(board, player, used_cells)
+    if wins:
+        return bit_to_cell(board, wins & -wins)
+
+    # Check if opponent can win and block
+    blocks = winning_cells(board, opponent, used_cells)
+    if blocks:
+        return bit_to_cell(board, blocks & -blocks)
+
+    # No immediate win or block, choose random
+    return bit_to_cell(board, nth_set_bit(legal, random.randrange(legal.bit_count())))
+
+
+def draw_text_with_capsule(frame, text, font, font_scale, thickness, position, text_color, capsule_color, capsule_padding=20):
+    text_size = cv2.getTextSize(text, font, font_scale, thickness)[0]
+    text_x, text_y = position
+
+    # Calculate capsule dimensions
+    capsule_width = text_size[0] + capsule_padding * 2
+    capsule_height = text_size[1] + capsule_padding * 2
+    capsule_top_left = (text_x - capsule_padding, text_y - text_size[1] - capsule_padding)
+    capsule_bottom_right = (text_x + text_size[0] + capsule_padding, text_y + capsule_padding)
+
+    # Draw the capsule (rounded rectangle)
+    radius = int(capsule_height / 2)
+    cv2.rectangle(frame, capsule_top_left, capsule_bottom_right, capsule_color, -1, lineType=cv2.LINE_AA)
+    cv2.circle(frame, (capsule_top_left[0] + radius, capsule_top_left[1] + radius), radius, capsule_color, -1, lineType=cv2.LINE_AA)
+    cv2.circle(frame, (capsule_bottom_right[0] - radius, capsule_top_left[1] + radius), radius, capsule_color, -1, lineType=cv2.LINE_AA)
+
+    # Draw the text
+    cv2.putText(frame, text, position, font, font_scale, text_color, thickness, cv2.LINE_AA)
+
+
+def main():
+    SIZE = random.randint(15, 20)  # Randomize the size of the board at the start
+    margin_x, margin_y, CELL_SIZE = calculate_margins_and_cell_size(SIZE)
+    board = new_board(SIZE)
+    used_cells = 0
+
+    frame = np.ones((HEIGHT, WIDTH, 3), dtype=np.uint8) * 255
+    players = ['O', 'X']
+    current_player_index = 0
+    last_move = None
+
+    score = {'O': 0, 'X': 0}
+
+    out = cv2.VideoWriter(filename, cv2.VideoWriter_fourcc(*'mp4v'), DRAW_FPS, (WIDTH, HEIGHT))
+
+    frame_count = 0
+
+    while frame_count < TOTAL_FRAMES:
+        draw_board(frame, board, margin_x, margin_y, CELL_SIZE, used_cells)
+        out.write(frame)
+        frame_count += 1
+
+        winner, win_info = check_winner(board, used_cells, last_move)
+        if winner:
+            color = O_COLOR if winner == 'O' else X_COLOR
+            used_cells = draw_strike_line(frame, margin_x, margin_y, CELL_SIZE, SIZE, win_info, color, used_cells)
+
+            score[winner] += 1  # Increment score
+
+            for _ in range(DRAW_FPS):  # Pause briefly to show the strike
+                if frame_count >= TOTAL_FRAMES:
+                    break
+                out.write(frame)
+                frame_count += 1
+
+        player = players[current_player_index]
+        opponent = players[(current_player_index + 1) % 2]
+
+        row, col = random_move(board, player, opponent, used_cells)
+        if row is not None and col is not None:
+            # Ensure the move is placed on an empty cell
+            if not is_occupied(board, row, col):
+                center = (margin_x + col * CELL_SIZE + CELL_SIZE // 2,
+                          margin_y + row * CELL_SIZE + CELL_SIZE // 2)
+                if player == 'O':
+                    for frame in animate_O(frame.copy(), center, CELL_SIZE):
+                        if frame_count >= TOTAL_FRAMES:
+                            break
+                        out.write(frame)
+                        frame_count += 1
+                else:
+                    for frame in animate_X(frame.copy(), center, CELL_SIZE):
+                        if frame_count >= TOTAL_FRAMES:
+                            break
+                        out.write(frame)
+                        frame_count += 1
+
+                board[player] |= cell_bit(board, row, col)
+            last_move = (row, col)
+
+        if frame_count >= TOTAL_FRAMES:
+            break
+
+        current_player_index = (current_player_index + 1) % 2
+
+        # Check if the board is full and restart
+        if not legal_moves(board, used_cells):
+            text = f"Game Over! O: {score['O']} - X: {score['X']}"
+            draw_text_with_capsule(frame, text, FONT, 1.5, 3, ((WIDTH - cv2.getTextSize(text, FONT, 1.5, 3)[0][0]) // 2,
+                                                              (HEIGHT + cv2.getTextSize(text, FONT, 1.5, 3)[0][1]) // 2), LINE_COLOR, (255, 255, 255))
+            for _ in range(DRAW_FPS * 2):  # Pause to show the final score
+                if frame_count >= TOTAL_FRAMES:
+                    break
+                out.write(frame)
+                frame_count += 1
+
+            # Reset the board
+            board = new_board(SIZE)
+            used_cells = 0
+            frame = np.ones((HEIGHT, WIDTH, 3), dtype=np.uint8) * 255  # Clear frame
+            score = {'O': 0, 'X': 0}  # Reset the score
+            current_player_index = 0
+            last_move = None
+
+    out.release()
+    cv2.destroyAllWindows()
+
+
+if __name__ == "__main__":
+    main()
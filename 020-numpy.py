@@ -0,0 +1,321 @@
+import cv2
+import numpy as np
+import random
+import os
+import time
+
+# Constants
+WIDTH, HEIGHT = 1920, 1080
+LINE_COLOR = (0, 0, 0)
+LINE_THICKNESS = 5
+O_COLOR = (255, 0, 0)
+X_COLOR = (0, 0, 255)
+STRIKE_THICKNESS = 10
+FONT = cv2.FONT_HERSHEY_SIMPLEX
+DRAW_FPS = 60  # Frames per second
+ANIMATION_FRAMES = 5  # Number of frames for each drawing animation
+VIDEO_DURATION = 60 * 60  # Duration of the video in seconds
+TOTAL_FRAMES = VIDEO_DURATION * DRAW_FPS  # Total frames for the video
+
+# Board cell codes (the board is an int8 array, used_cells a bool array). check_winner only reads the
+# 5x5 neighbourhood of the last move; winning_moves scores every free cell for both players in one pass.
+EMPTY = 0
+CODES = {'O': 1, 'X': 2}
+SYMBOLS = ('', 'O', 'X')
+
+# Ensure render directory exists
+if not os.path.exists('render'):
+    os.makedirs('render')
+
+# Get epoch time for filename
+epoch_time = int(time.time())
+filename = f'render/tic_tac_toe_animated_{epoch_time}.mp4'
+
+
+def calculate_margins_and_cell_size(SIZE):
+    max_cell_size = min(WIDTH, HEIGHT) // SIZE - LINE_THICKNESS
+    margin_x = (WIDTH - (max_cell_size * SIZE)) // 2
+    margin_y = (HEIGHT - (max_cell_size * SIZE)) // 2
+    return margin_x, margin_y, max_cell_size
+
+
+def draw_board(frame, board, margin_x, margin_y, CELL_SIZE, used_cells):
+    SIZE = board.shape[0]
+    for i in range(1, SIZE):
+        # Horizontal lines
+        cv2.line(frame, (margin_x, margin_y + i * CELL_SIZE),
+                 (margin_x + CELL_SIZE * SIZE, margin_y + i * CELL_SIZE), LINE_COLOR, LINE_THICKNESS)
+        # Vertical lines
+        cv2.line(frame, (margin_x + i * CELL_SIZE, margin_y),
+                 (margin_x + i * CELL_SIZE, margin_y + CELL_SIZE * SIZE), LINE_COLOR, LINE_THICKNESS)
+
+    for row, col in np.argwhere(board == CODES['O']):
+        center = (margin_x + col * CELL_SIZE + CELL_SIZE // 2,
+                  margin_y + row * CELL_SIZE + CELL_SIZE // 2)
+        cv2.circle(frame, center, CELL_SIZE // 3, O_COLOR, LINE_THICKNESS)
+    for row, col in np.argwhere(board == CODES['X']):
+        center = (margin_x + col * CELL_SIZE + CELL_SIZE // 2,
+                  margin_y + row * CELL_SIZE + CELL_SIZE // 2)
+        cv2.line(frame, (center[0] - CELL_SIZE // 4, center[1] - CELL_SIZE // 4),
+                 (center[0] + CELL_SIZE // 4, center[1] + CELL_SIZE // 4), X_COLOR, LINE_THICKNESS)
+        cv2.line(frame, (center[0] + CELL_SIZE // 4, center[1] - CELL_SIZE // 4),
+                 (center[0] - CELL_SIZE // 4, center[1] + CELL_SIZE // 4), X_COLOR, LINE_THICKNESS)
+    for row, col in np.argwhere(used_cells):
+        cv2.rectangle(frame, (margin_x + col * CELL_SIZE, margin_y + row * CELL_SIZE),
+                      (margin_x + (col + 1) * CELL_SIZE, margin_y + (row + 1) * CELL_SIZE),
+                      (0, 255, 0), 3)
+
+
+def animate_O(frame, center, CELL_SIZE):
+    for i in range(ANIMATION_FRAMES):
+        angle = int(360 * i / ANIMATION_FRAMES)
+        axes = (CELL_SIZE // 3, CELL_SIZE // 3)
+        cv2.ellipse(frame, center, axes, 0, 0, angle, O_COLOR, LINE_THICKNESS)
+        yield frame.copy()
+
+
+def animate_X(frame, center, CELL_SIZE):
+    line_step = CELL_SIZE // (4 * ANIMATION_FRAMES)
+    # Draw the first diagonal
+    for i in range(ANIMATION_FRAMES):
+        cv2.line(frame, (center[0] - line_step * i, center[1] - line_step * i),
+                 (center[0] - CELL_SIZE // 4, center[1] - CELL_SIZE // 4), X_COLOR, LINE_THICKNESS)
+        cv2.line(frame, (center[0] + CELL_SIZE // 4, center[1] + CELL_SIZE // 4),
+                 (center[0] + line_step * i, center[1] + line_step * i), X_COLOR, LINE_THICKNESS)
+        yield frame.copy()
+    # Draw the second diagonal
+    for i in range(ANIMATION_FRAMES):
+        cv2.line(frame, (center[0] + line_step * i, center[1] - line_step * i),
+                 (center[0] + CELL_SIZE // 4, center[1] - CELL_SIZE // 4), X_COLOR, LINE_THICKNESS)
+        cv2.line(frame, (center[0] - CELL_SIZE // 4, center[1] + CELL_SIZE // 4),
+                 (center[0] - line_step * i, center[1] + line_step * i), X_COLOR, LINE_THICKNESS)
+        yield frame.copy()
+
+
+def check_winner(board, used_cells, last_move):
+    # Only windows through the last move can have been completed by it, and they all
+    # lie in the 5x5 neighbourhood of that cell
+    if last_move is None:
+        return None, None
+    SIZE = board.shape[0]
+    r, c = last_move
+    player = board[r, c]
+    if player == EMPTY or used_cells[r, c]:
+        return None, None
+
+    r0, c0 = max(0, r - 2), max(0, c - 2)
+    owned = ((board[r0:r + 3, c0:c + 3] == player) & ~used_cells[r0:r + 3, c0:c + 3]).tolist()
+    lines = [('row', c0, owned[r - r0]), ('col', r0, [cells[c - c0] for cells in owned])]
+    if r == c:  # The neighbourhood is square on either diagonal
+        lines.append(('diag', r0, [owned[k][k] for k in range(len(owned))]))
+    if r + c == SIZE - 1:
+        lines.append(('anti_diag', r0, [owned[k][-1 - k] for k in range(len(owned))]))
+
+    for kind, first, line in lines:
+        for k in range(len(line) - 2):
+            if line[k] and line[k + 1] and line[k + 2]:
+                if kind == 'row':
+                    return SYMBOLS[player], ('row', r, first + k)
+                if kind == 'col':
+                    return SYMBOLS[player], ('col', c, first + k)
+                return SYMBOLS[player], (kind, first + k)
+
+    return None, None
+
+
+def winning_moves(board, used_cells):
+    # For both players at once, every legal cell that would complete three in a row.
+    # Returns a (2, SIZE, SIZE) bool array: index 0 for 'O', index 1 for 'X'.
+    SIZE = board.shape[0]
+    empty = (board == EMPTY) & ~used_cells
+    mine = (board == np.array([CODES['O'], CODES['X']], dtype=np.int8)[:, None, None]) & ~used_cells
+    count = mine.astype(np.int8)
+    free = empty.astype(np.int8)
+    n = SIZE - 2
+    hits = np.zeros((2, SIZE, SIZE), dtype=bool)
+
+    # A window can be completed when it holds two pieces of the player and one free cell
+    rows = (count[:, :, :-2] + count[:, :, 1:-1] + count[:, :, 2:] == 2) & \
+        (free[:, :-2] + free[:, 1:-1] + free[:, 2:] == 1)
+    cols = (count[:, :-2, :] + count[:, 1:-1, :] + count[:, 2:, :] == 2) & \
+        (free[:-2, :] + free[1:-1, :] + free[2:, :] == 1)
+    idx = np.arange(SIZE)
+    diag_count, diag_free = count[:, idx, idx], free[idx, idx]
+    anti_count, anti_free = count[:, idx, SIZE - 1 - idx], free[idx, SIZE - 1 - idx]
+    diag = (diag_count[:, :-2] + diag_count[:, 1:-1] + diag_count[:, 2:] == 2) & \
+        (diag_free[:-2] + diag_free[1:-1] + diag_free[2:] == 1)
+    anti_diag = (anti_count[:, :-2] + anti_count[:, 1:-1] + anti_count[:, 2:] == 2) & \
+        (anti_free[:-2] + anti_free[1:-1] + anti_free[2:] == 1)
+
+    # Scatter each candidate window back onto its free cell
+    diag_hits = np.zeros((2, SIZE), dtype=bool)
+    anti_hits = np.zeros((2, SIZE), dtype=bool)
+    for k in range(3):
+        hits[:, :, k:k + n] |= rows & empty[:, k:k + n]
+        hits[:, k:k + n, :] |= cols & empty[k:k + n, :]
+        diag_hits[:, k:k + n] |= diag & (diag_free[k:k + n] == 1)
+        anti_hits[:, k:k + n] |= anti_diag & (anti_free[k:k + n] == 1)
+    hits[:, idx, idx] |= diag_hits
+    hits[:, idx, SIZE - 1 - idx] |= anti_hits
+    return hits
+
+
+def draw_strike_line(frame, margin_x, margin_y, CELL_SIZE, SIZE, win_info, color, used_cells):
+    if win_info[0] == 'row':
+        _, row, col_start = win_info
+        start_point = (margin_x + col_start * CELL_SIZE, margin_y + row * CELL_SIZE + CELL_SIZE // 2)
+        end_point = (margin_x + (col_start + 3) * CELL_SIZE, margin_y + row * CELL_SIZE + CELL_SIZE // 2)
+        used_cells[row][col_start] = used_cells[row][col_start+1] = used_cells[row][col_start+2] = True
+    elif win_info[0] == 'col':
+        _, col, row_start = win_info
+        start_point = (margin_x + col * CELL_SIZE + CELL_SIZE // 2, margin_y + row_start * CELL_SIZE)
+        end_point = (margin_x + col * CELL_SIZE + CELL_SIZE // 2, margin_y + (row_start + 3) * CELL_SIZE)
+        used_cells[row_start][col] = used_cells[row_start+1][col] = used_cells[row_start+2][col] = True
+    elif win_info[0] == 'diag':
+        _, start_idx = win_info
+        start_point = (margin_x + start_idx * CELL_SIZE, margin_y + start_idx * CELL_SIZE)
+        end_point = (margin_x + (start_idx + 3) * CELL_SIZE, margin_y + (start_idx + 3) * CELL_SIZE)
+        used_cells[start_idx][start_idx] = used_cells[start_idx+1][start_idx+1] = used_cells[start_idx+2][start_idx+2] = True
+    elif win_info[0] == 'anti_diag':
+        _, start_idx = win_info
+        start_point = (margin_x + (SIZE - start_idx - 1) * CELL_SIZE, margin_y + start_idx * CELL_SIZE)
+        end_point = (margin_x + (SIZE - start_idx - 4) * CELL_SIZE, margin_y + (start_idx + 3) * CELL_SIZE)
+        used_cells[start_idx][SIZE-start_idx-1] = used_cells[start_idx+1][SIZE-start_idx-2] = used_cells[start_idx+2][SIZE-start_idx-3] = True
+
+    cv2.line(frame, start_point, end_point, color, STRIKE_THICKNESS)
+
+
+def random_move(board, player, opponent, used_cells):
+    empty_cells = np.argwhere((board == EMPTY) & ~used_cells)
+    if not len(empty_cells):
+        return None, None
+
+    hits = winning_moves(board, used_cells)
+
+    # Check if player can win
+    wins = np.argwhere(hits[CODES[player] - 1])
+    if len(wins):
+        r, c = wins[0]
+        return int(r), int(c)
+
+    # Check if opponent can win and block
+    blocks = np.argwhere(hits[CODES[opponent] - 1])
+    if len(blocks):
+        r, c = blocks[0]
+        return int(r), int(c)
+
+    # No immediate win or block, choose random
+    r, c = random.choice(empty_cells)
+    return int(r), int(c)
+
+
+def draw_text_with_capsule(frame, text, font, font_scale, thickness, position, text_color, capsule_color, capsule_padding=20):
+    text_size = cv2.getTextSize(text, font, font_scale, thickness)[0]
+    text_x, text_y = position
+
+    # Calculate capsule dimensions
+    capsule_width = text_size[0] + capsule_padding * 2
+    capsule_height = text_size[1] + capsule_padding * 2
+    capsule_top_left = (text_x - capsule_padding, text_y - text_size[1] - capsule_padding)
+    capsule_bottom_right = (text_x + text_size[0] + capsule_padding, text_y + capsule_padding)
+
+    # Draw the capsule (rounded rectangle)
+    radius = int(capsule_height / 2)
+    cv2.rectangle(frame, capsule_top_left, capsule_bottom_right, capsule_color, -1, lineType=cv2.LINE_AA)
+    cv2.circle(frame, (capsule_top_left[0] + radius, capsule_top_left[1] + radius), radius, capsule_color, -1, lineType=cv2.LINE_AA)
+    cv2.circle(frame, (capsule_bottom_right[0] - radius, capsule_top_left[1] + radius), radius, capsule_color, -1, lineType=cv2.LINE_AA)
+
+    # Draw the text
+    cv2.putText(frame, text, position, font, font_scale, text_color, thickness, cv2.LINE_AA)
+
+
+def main():
+    SIZE = random.randint(15, 20)  # Randomize the size of the board at the start
+    margin_x, margin_y, CELL_SIZE = calculate_margins_and_cell_size(SIZE)
+    board = np.zeros((SIZE, SIZE), dtype=np.int8)
+    used_cells = np.zeros((SIZE, SIZE), dtype=bool)
+
+    frame = np.ones((HEIGHT, WIDTH, 3), dtype=np.uint8) * 255
+    players = ['O', 'X']
+    current_player_index = 0
+    last_move = None
+
+    score = {'O': 0, 'X': 0}
+
+    out = cv2.VideoWriter(filename, cv2.VideoWriter_fourcc(*'mp4v'), DRAW_FPS, (WIDTH, HEIGHT))
+
+    frame_count = 0
+
+    while frame_count < TOTAL_FRAMES:
+        draw_board(frame, board, margin_x, margin_y, CELL_SIZE, used_cells)
+        out.write(frame)
+        frame_count += 1
+
+        winner, win_info = check_winner(board, used_cells, last_move)
+        if winner:
+            color = O_COLOR if winner == 'O' else X_COLOR
+            draw_strike_line(frame, margin_x, margin_y, CELL_SIZE, SIZE, win_info, color, used_cells)
+
+            score[winner] += 1  # Increment score
+
+            for _ in range(DRAW_FPS):  # Pause briefly to show the strike
+                if frame_count >= TOTAL_FRAMES:
+                    break
+                out.write(frame)
+                frame_count += 1
+
+        player = players[current_player_index]
+        opponent = players[(current_player_index + 1) % 2]
+
+        row, col = random_move(board, player, opponent, used_cells)
+        if row is not None and col is not None:
+            # Ensure the move is placed on an empty cell
+            if board[row, col] == EMPTY:
+                center = (margin_x + col * CELL_SIZE + CELL_SIZE // 2,
+                          margin_y + row * CELL_SIZE + CELL_SIZE // 2)
+                if player == 'O':
+                    for frame in animate_O(frame.copy(), center, CELL_SIZE):
+                        if frame_count >= TOTAL_FRAMES:
+                            break
+                        out.write(frame)
+                        frame_count += 1
+                else:
+                    for frame in animate_X(frame.copy(), center, CELL_SIZE):
+                        if frame_count >= TOTAL_FRAMES:
+                            break
+                        out.write(frame)
+                        frame_count += 1
+
+                board[row, col] = CODES[player]
+            last_move = (row, col)
+
+        if frame_count >= TOTAL_FRAMES:
+            break
+
+        current_player_index = (current_player_index + 1) % 2
+
+        # Check if the board is full and restart
+        if not ((board == EMPTY) & ~used_cells).any():
+            text = f"Game Over! O: {score['O']} - X: {score['X']}"
+            draw_text_with_capsule(frame, text, FONT, 1.5, 3, ((WIDTH - cv2.getTextSize(text, FONT, 1.5, 3)[0][0]) // 2,
+                                                              (HEIGHT + cv2.getTextSize(text, FONT, 1.5, 3)[0][1]) // 2), LINE_COLOR, (255, 255, 255))
+            for _ in range(DRAW_FPS * 2):  # Pause to show the final score
+                if frame_count >= TOTAL_FRAMES:
+                    break
+                out.write(frame)
+                frame_count += 1
+
+            # Reset the board
+            board.fill(EMPTY)
+            used_cells.fill(False)
+            frame = np.ones((HEIGHT, WIDTH, 3), dtype=np.uint8) * 255  # Clear frame
+            score = {'O': 0, 'X': 0}  # Reset the score
+            current_player_index = 0
+            last_move = None
+
+    out.release()
+    cv2.destroyAllWindows()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,393 @@
+import cv2
+import numpy as np
+import random
+import os
+import sys
+import time
+
+# Constants
+WIDTH, HEIGHT = 1920, 1080
+LINE_COLOR = (0, 0, 0)
+LINE_THICKNESS = 5
+O_COLOR = (255, 0, 0)
+X_COLOR = (0, 0, 255)
+STRIKE_THICKNESS = 10
+FONT = cv2.FONT_HERSHEY_SIMPLEX
+DRAW_FPS = 60  # Frames per second
+ANIMATION_FRAMES = 5  # Number of frames for each drawing animation
+VIDEO_DURATION = 60 * 60  # Duration of the video in seconds
+TOTAL_FRAMES = VIDEO_DURATION * DRAW_FPS  # Total frames for the video
+WIN_LENGTH = 3  # Pieces in a row needed to score
+
+# Headless mode: run with --headless to only simulate games and print statistics, without video
+HEADLESS = '--headless' in sys.argv
+SIMULATION_SIZES = range(10, 21)  # Board sizes to simulate
+SIMULATION_GAMES = 1000  # Games per board size
+
+# Ensure render directory exists
+if not os.path.exists('render'):
+    os.makedirs('render')
+
+# Get epoch time for filename
+epoch_time = int(time.time())
+filename = f'render/tic_tac_toe_animated_{epoch_time}.mp4'
+
+
+def calculate_margins_and_cell_size(SIZE):
+    max_cell_size = min(WIDTH, HEIGHT) // SIZE - LINE_THICKNESS
+    margin_x = (WIDTH - (max_cell_size * SIZE)) // 2
+    margin_y = (HEIGHT - (max_cell_size * SIZE)) // 2
+    return margin_x, margin_y, max_cell_size
+
+
+def build_window_table(SIZE, length=WIN_LENGTH):
+    # Every line of 'length' cells on the board (rows, columns and all diagonals in both
+    # directions), plus the ids of the windows each cell belongs to. Built once per board size.
+    windows = []
+    cell_windows = {(r, c): [] for r in range(SIZE) for c in range(SIZE)}
+    for dr, dc in ((0, 1), (1, 0), (1, 1), (1, -1)):
+        for r in range(SIZE):
+            for c in range(SIZE):
+                end_r, end_c = r + (length - 1) * dr, c + (length - 1) * dc
+                if 0 <= end_r < SIZE and 0 <= end_c < SIZE:
+                    window = tuple((r + i * dr, c + i * dc) for i in range(length))
+                    for cell in window:
+                        cell_windows[cell].append(len(windows))
+                    windows.append(window)
+    return {'windows': windows, 'cell_windows': cell_windows}
+
+
+def draw_board(frame, board, margin_x, margin_y, CELL_SIZE, used_cells):
+    SIZE = len(board)
+    for i in range(1, SIZE):
+        # Horizontal lines
+        cv2.line(frame, (margin_x, margin_y + i * CELL_SIZE),
+                 (margin_x + CELL_SIZE * SIZE, margin_y + i * CELL_SIZE), LINE_COLOR, LINE_THICKNESS)
+        # Vertical lines
+        cv2.line(frame, (margin_x + i * CELL_SIZE, margin_y),
+                 (margin_x + i * CELL_SIZE, margin_y + CELL_SIZE * SIZE), LINE_COLOR, LINE_THICKNESS)
+
+    for row in range(SIZE):
+        for col in range(SIZE):
+            center = (margin_x + col * CELL_SIZE + CELL_SIZE // 2,
+                      margin_y + row * CELL_SIZE + CELL_SIZE // 2)
+            if board[row][col] == 'O':
+                cv2.circle(frame, center, CELL_SIZE // 3, O_COLOR, LINE_THICKNESS)
+            elif board[row][col] == 'X':
+                cv2.line(frame, (center[0] - CELL_SIZE // 4, center[1] - CELL_SIZE // 4),
+                         (center[0] + CELL_SIZE // 4, center[1] + CELL_SIZE // 4), X_COLOR, LINE_THICKNESS)
+                cv2.line(frame, (center[0] + CELL_SIZE // 4, center[1] - CELL_SIZE // 4),
+                         (center[0] - CELL_SIZE // 4, center[1] + CELL_SIZE // 4), X_COLOR, LINE_THICKNESS)
+            if used_cells[row][col]:
+                cv2.rectangle(frame, (margin_x + col * CELL_SIZE, margin_y + row * CELL_SIZE),
+                              (margin_x + (col + 1) * CELL_SIZE, margin_y + (row + 1) * CELL_SIZE),
+                              (0, 255, 0), 3)
+
+
+def animate_O(frame, center, CELL_SIZE):
+    for i in range(ANIMATION_FRAMES):
+        angle = int(360 * i / ANIMATION_FRAMES)
+        axes = (CELL_SIZE // 3, CELL_SIZE // 3)
+        cv2.ellipse(frame, center, axes, 0, 0, angle, O_COLOR, LINE_THICKNESS)
+        yield frame.copy()
+
+
+def animate_X(frame, center, CELL_SIZE):
+    line_step = CELL_SIZE // (4 * ANIMATION_FRAMES)
+    # Draw the first diagonal
+    for i in range(ANIMATION_FRAMES):
+        cv2.line(frame, (center[0] - line_step * i, center[1] - line_step * i),
+                 (center[0] - CELL_SIZE // 4, center[1] - CELL_SIZE // 4), X_COLOR, LINE_THICKNESS)
+        cv2.line(frame, (center[0] + CELL_SIZE // 4, center[1] + CELL_SIZE // 4),
+                 (center[0] + line_step * i, center[1] + line_step * i), X_COLOR, LINE_THICKNESS)
+        yield frame.copy()
+    # Draw the second diagonal
+    for i in range(ANIMATION_FRAMES):
+        cv2.line(frame, (center[0] + line_step * i, center[1] - line_step * i),
+                 (center[0] + CELL_SIZE // 4, center[1] - CELL_SIZE // 4), X_COLOR, LINE_THICKNESS)
+        cv2.line(frame, (center[0] - CELL_SIZE // 4, center[1] + CELL_SIZE // 4),
+                 (center[0] - line_step * i, center[1] + line_step * i), X_COLOR, LINE_THICKNESS)
+        yield frame.copy()
+
+
+def check_winner(board, used_cells, last_move, window_table):
+    # Only the windows that contain the last placed piece can have been completed by it
+    if last_move is None:
+        return None, None
+    r, c = last_move
+    player = board[r][c]
+    if player == '' or used_cells[r][c]:
+        return None, None
+
+    windows = window_table['windows']
+    for window_id in window_table['cell_windows'][last_move]:
+        window = windows[window_id]
+        if all(board[wr][wc] == player and not used_cells[wr][wc] for wr, wc in window):
+            return player, window
+
+    return None, None
+
+
+def draw_strike_line(frame, margin_x, margin_y, CELL_SIZE, win_info, color):
+    # Run the line from the outer edge of the first cell to the outer edge of the last one
+    (first_r, first_c), (last_r, last_c) = win_info[0], win_info[-1]
+    dr = (last_r - first_r) // (len(win_info) - 1)
+    dc = (last_c - first_c) // (len(win_info) - 1)
+    start_point = (margin_x + first_c * CELL_SIZE + CELL_SIZE // 2 - dc * CELL_SIZE // 2,
+                   margin_y + first_r * CELL_SIZE + CELL_SIZE // 2 - dr * CELL_SIZE // 2)
+    end_point = (margin_x + last_c * CELL_SIZE + CELL_SIZE // 2 + dc * CELL_SIZE // 2,
+                 margin_y + last_r * CELL_SIZE + CELL_SIZE // 2 + dr * CELL_SIZE // 2)
+
+    cv2.line(frame, start_point, end_point, color, STRIKE_THICKNESS)
+
+
+def window_threat(board, used_cells, window):
+    # A window is a threat when all its cells but one hold pieces of the same player, none of them used
+    if any(used_cells[r][c] for r, c in window):
+        return None
+    values = [board[r][c] for r, c in window]
+    if values.count('') != 1:
+        return None
+    pieces = set(values)
+    pieces.discard('')
+    if len(pieces) != 1:
+        return None
+    return pieces.pop(), window[values.index('')]
+
+
+# Threat index: for each player, the empty cells that would complete one of their windows,
+# with how many windows each cell completes. Kept up to date on every placement and strike.
+def update_threats(threats, board, used_cells, window_table, window_ids, delta):
+    for window_id in window_ids:
+        threat = window_threat(board, used_cells, window_table['windows'][window_id])
+        if threat:
+            player, cell = threat
+            threats[player][cell] = threats[player].get(cell, 0) + delta
+            if not threats[player][cell]:
+                del threats[player][cell]
+
+
+# Free-cell pool: the first 'count' entries of 'cells' are the empty cells, 'index' gives
+# the position of each cell in 'cells'. Taking a cell swaps it to the end of the free part.
+def new_free_pool(SIZE):
+    cells = [(r, c) for r in range(SIZE) for c in range(SIZE)]
+    return {'cells': cells, 'index': {cell: i for i, cell in enumerate(cells)}, 'count': len(cells)}
+
+
+def take_free_cell(free_pool, cell):
+    cells, index = free_pool['cells'], free_pool['index']
+    i = index[cell]
+    last = free_pool['count'] - 1
+    other = cells[last]
+    cells[i], cells[last] = other, cell
+    index[other], index[cell] = i, last
+    free_pool['count'] = last
+
+
+def reset_free_pool(free_pool):
+    # Every taken cell sits after 'count', so restoring the counter frees them all
+    free_pool['count'] = len(free_pool['cells'])
+
+
+def place_piece(board, used_cells, window_table, threats, free_pool, row, col, player):
+    window_ids = window_table['cell_windows'][(row, col)]
+    update_threats(threats, board, used_cells, window_table, window_ids, -1)
+    board[row][col] = player
+    take_free_cell(free_pool, (row, col))
+    update_threats(threats, board, used_cells, window_table, window_ids, 1)
+
+
+def strike_cells(board, used_cells, window_table, threats, cells):
+    # Struck cells already hold pieces, so the free-cell pool does not change here
+    window_ids = set()
+    for cell in cells:
+        window_ids.update(window_table['cell_windows'][cell])
+    update_threats(threats, board, used_cells, window_table, window_ids, -1)
+    for r, c in cells:
+        used_cells[r][c] = True
+    update_threats(threats, board, used_cells, window_table, window_ids, 1)
+
+
+def random_move(board, player, opponent, used_cells, threats, free_pool):
+    if not free_pool['count']:
+        return None, None
+
+    # Check if player can win (first cell in board order, as a full scan would find it)
+    if threats[player]:
+        return min(threats[player])
+
+    # Check if opponent can win and block
+    if threats[opponent]:
+        return min(threats[opponent])
+
+    # No immediate win or block, choose random
+    return free_pool['cells'][random.randrange(free_pool['count'])]
+
+
+def draw_text_with_capsule(frame, text, font, font_scale, thickness, position, text_color, capsule_color, capsule_padding=20):
+    text_size = cv2.getTextSize(text, font, font_scale, thickness)[0]
+    text_x, text_y = position
+
+    # Calculate capsule dimensions
+    capsule_width = text_size[0] + capsule_padding * 2
+    capsule_height = text_size[1] + capsule_padding * 2
+    capsule_top_left = (text_x - capsule_padding, text_y - text_size[1] - capsule_padding)
+    capsule_bottom_right = (text_x + text_size[0] + capsule_padding, text_y + capsule_padding)
+
+    # Draw the capsule (rounded rectangle)
+    radius = int(capsule_height / 2)
+    cv2.rectangle(frame, capsule_top_left, capsule_bottom_right, capsule_color, -1, lineType=cv2.LINE_AA)
+    cv2.circle(frame, (capsule_top_left[0] + radius, capsule_top_left[1] + radius), radius, capsule_color, -1, lineType=cv2.LINE_AA)
+    cv2.circle(frame, (capsule_bottom_right[0] - radius, capsule_top_left[1] + radius), radius, capsule_color, -1, lineType=cv2.LINE_AA)
+
+    # Draw the text
+    cv2.putText(frame, text, position, font, font_scale, text_color, thickness, cv2.LINE_AA)
+
+
+def play_game(SIZE, window_table, free_pool):
+    # Plays one game and yields what happens, so it can be rendered or just counted:
+    # ('start', board, used_cells), ('strike', winner, win_info), ('move', player, row, col), ('game_over', score)
+    board = [['' for _ in range(SIZE)] for _ in range(SIZE)]
+    used_cells = [[False for _ in range(SIZE)] for _ in range(SIZE)]
+    threats = {'O': {}, 'X': {}}
+    reset_free_pool(free_pool)
+    players = ['O', 'X']
+    current_player_index = 0
+    last_move = None
+    score = {'O': 0, 'X': 0}
+
+    yield 'start', board, used_cells
+
+    while True:
+        winner, win_info = check_winner(board, used_cells, last_move, window_table)
+        if winner:
+            strike_cells(board, used_cells, window_table, threats, win_info)
+            score[winner] += 1  # Increment score
+            yield 'strike', winner, win_info
+
+        player = players[current_player_index]
+        opponent = players[(current_player_index + 1) % 2]
+
+        row, col = random_move(board, player, opponent, used_cells, threats, free_pool)
+        if row is not None and col is not None:
+            place_piece(board, used_cells, window_table, threats, free_pool, row, col, player)
+            last_move = (row, col)
+            yield 'move', player, row, col
+
+        current_player_index = (current_player_index + 1) % 2
+
+        # Check if the board is full
+        if not free_pool['count']:
+            yield 'game_over', score
+            return
+
+
+def main():
+    SIZE = random.randint(15, 20)  # Randomize the size of the board at the start
+    margin_x, margin_y, CELL_SIZE = calculate_margins_and_cell_size(SIZE)
+    window_table = build_window_table(SIZE)
+    free_pool = new_free_pool(SIZE)
+
+    out = cv2.VideoWriter(filename, cv2.VideoWriter_fourcc(*'mp4v'), DRAW_FPS, (WIDTH, HEIGHT))
+
+    frame_count = 0
+
+    while frame_count < TOTAL_FRAMES:
+        for event in play_game(SIZE, window_table, free_pool):
+            if event[0] == 'start':
+                _, board, used_cells = event
+                frame = np.ones((HEIGHT, WIDTH, 3), dtype=np.uint8) * 255  # Clear frame
+                draw_board(frame, board, margin_x, margin_y, CELL_SIZE, used_cells)
+                out.write(frame)
+                frame_count += 1
+
+            elif event[0] == 'strike':
+                _, winner, win_info = event
+                color = O_COLOR if winner == 'O' else X_COLOR
+                draw_strike_line(frame, margin_x, margin_y, CELL_SIZE, win_info, color)
+
+                for _ in range(DRAW_FPS):  # Pause briefly to show the strike
+                    if frame_count >= TOTAL_FRAMES:
+                        break
+                    out.write(frame)
+                    frame_count += 1
+
+            elif event[0] == 'move':
+                _, player, row, col = event
+                center = (margin_x + col * CELL_SIZE + CELL_SIZE // 2,
+                          margin_y + row * CELL_SIZE + CELL_SIZE // 2)
+                if player == 'O':
+                    for frame in animate_O(frame.copy(), center, CELL_SIZE):
+                        if frame_count >= TOTAL_FRAMES:
+                            break
+                        out.write(frame)
+                        frame_count += 1
+                else:
+                    for frame in animate_X(frame.copy(), center, CELL_SIZE):
+                        if frame_count >= TOTAL_FRAMES:
+                            break
+                        out.write(frame)
+                        frame_count += 1
+
+                if frame_count < TOTAL_FRAMES:
+                    draw_board(frame, board, margin_x, margin_y, CELL_SIZE, used_cells)
+                    out.write(frame)
+                    frame_count += 1
+
+            elif event[0] == 'game_over':
+                _, score = event
+                text = f"Game Over! O: {score['O']} - X: {score['X']}"
+                draw_text_with_capsule(frame, text, FONT, 1.5, 3, ((WIDTH - cv2.getTextSize(text, FONT, 1.5, 3)[0][0]) // 2,
+                                                                  (HEIGHT + cv2.getTextSize(text, FONT, 1.5, 3)[0][1]) // 2), LINE_COLOR, (255, 255, 255))
+                for _ in range(DRAW_FPS * 2):  # Pause to show the final score
+                    if frame_count >= TOTAL_FRAMES:
+                        break
+                    out.write(frame)
+                    frame_count += 1
+
+            if frame_count >= TOTAL_FRAMES:
+                break
+
+    out.release()
+    cv2.destroyAllWindows()
+
+
+def simulate():
+    # Same games as main(), without drawing or encoding anything
+    for SIZE in SIMULATION_SIZES:
+        window_table = build_window_table(SIZE)
+        free_pool = new_free_pool(SIZE)
+        total_strikes = total_moves = 0
+        total_score = {'O': 0, 'X': 0}
+        results = {'O': 0, 'X': 0, 'Draw': 0}
+
+        start_time = time.time()
+        for _ in range(SIMULATION_GAMES):
+            for event in play_game(SIZE, window_table, free_pool):
+                if event[0] == 'strike':
+                    total_strikes += 1
+                elif event[0] == 'move':
+                    total_moves += 1
+                elif event[0] == 'game_over':
+                    score = event[1]
+            total_score['O'] += score['O']
+            total_score['X'] += score['X']
+            if score['O'] == score['X']:
+                results['Draw'] += 1
+            else:
+                results['O' if score['O'] > score['X'] else 'X'] += 1
+        elapsed = time.time() - start_time
+
+        games = SIMULATION_GAMES
+        print(f"SIZE {SIZE}: {games / elapsed:.1f} games/s | "
+              f"strikes/game {total_strikes / games:.2f} | moves/game {total_moves / games:.1f} | "
+              f"score O {total_score['O'] / games:.2f} - X {total_score['X'] / games:.2f} | "
+              f"wins O {100 * results['O'] / games:.1f}% X {100 * results['X'] / games:.1f}% "
+              f"draws {100 * results['Draw'] / games:.1f}%")
+
+
+if __name__ == "__main__":
+    if HEADLESS:
+        simulate()
+    else:
+        main()
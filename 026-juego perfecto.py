@@ -0,0 +1,235 @@
+import cv2
+import numpy as np
+import random
+import os
+import time
+from array import array
+from bisect import bisect_left
+
+# Constants
+SIZE = 3
+WIDTH, HEIGHT = 1920, 1080
+CELL_SIZE = 150  # Smaller cell size
+LINE_COLOR = (0, 0, 0)
+LINE_THICKNESS = 5
+O_COLOR = (255, 0, 0)
+X_COLOR = (0, 0, 255)
+FONT = cv2.FONT_HERSHEY_SIMPLEX
+DRAW_FPS = 60  # Frames per second
+ANIMATION_FRAMES = 20  # Number of frames for each drawing animation
+PERFECT_PLAYERS = ('O', 'X')  # Players that take their moves from the perfect-play table
+
+# Calculate margins to center the board
+margin_x = (WIDTH - CELL_SIZE * SIZE) // 2
+margin_y = (HEIGHT - CELL_SIZE * SIZE) // 2
+
+# Ensure render directory exists
+if not os.path.exists('render'):
+    os.makedirs('render')
+
+# Get epoch time for filename
+epoch_time = int(time.time())
+filename = f'render/tic_tac_toe_animated_{epoch_time}.mp4'
+table_filename = 'render/perfect_3x3.bin'
+
+# The 8 symmetries of the board, as index permutations: transformed[i] = cells[perm[i]]
+SYMMETRIES = [[f(r, c)[0] * 3 + f(r, c)[1] for r in range(3) for c in range(3)]
+              for f in (lambda r, c: (r, c), lambda r, c: (c, 2 - r), lambda r, c: (2 - r, 2 - c), lambda r, c: (2 - c, r),
+                        lambda r, c: (r, 2 - c), lambda r, c: (2 - r, c), lambda r, c: (c, r), lambda r, c: (2 - c, 2 - r))]
+LINES = [(0, 1, 2), (3, 4, 5), (6, 7, 8), (0, 3, 6), (1, 4, 7), (2, 5, 8), (0, 4, 8), (2, 4, 6)]
+PIECE_CODES = {'': 0, 'O': 1, 'X': 2}
+
+def draw_board(frame, board):
+    for i in range(1, SIZE):
+        # Horizontal lines
+        cv2.line(frame, (margin_x, margin_y + i * CELL_SIZE), 
+                 (margin_x + CELL_SIZE * SIZE, margin_y + i * CELL_SIZE), LINE_COLOR, LINE_THICKNESS)
+        # Vertical lines
+        cv2.line(frame, (margin_x + i * CELL_SIZE, margin_y), 
+                 (margin_x + i * CELL_SIZE, margin_y + CELL_SIZE * SIZE), LINE_COLOR, LINE_THICKNESS)
+        
+    for row in range(SIZE):
+        for col in range(SIZE):
+            center = (margin_x + col * CELL_SIZE + CELL_SIZE // 2, 
+                      margin_y + row * CELL_SIZE + CELL_SIZE // 2)
+            if board[row][col] == 'O':
+                cv2.circle(frame, center, CELL_SIZE // 3, O_COLOR, LINE_THICKNESS)
+            elif board[row][col] == 'X':
+                cv2.line(frame, (center[0] - CELL_SIZE // 4, center[1] - CELL_SIZE // 4),
+                         (center[0] + CELL_SIZE // 4, center[1] + CELL_SIZE // 4), X_COLOR, LINE_THICKNESS)
+                cv2.line(frame, (center[0] + CELL_SIZE // 4, center[1] - CELL_SIZE // 4),
+                         (center[0] - CELL_SIZE // 4, center[1] + CELL_SIZE // 4), X_COLOR, LINE_THICKNESS)
+
+def animate_O(frame, center):
+    for i in range(ANIMATION_FRAMES):
+        angle = int(360 * i / ANIMATION_FRAMES)
+        axes = (CELL_SIZE // 3, CELL_SIZE // 3)
+        cv2.ellipse(frame, center, axes, 0, 0, angle, O_COLOR, LINE_THICKNESS)
+        yield frame.copy()
+
+def animate_X(frame, center):
+    line_step = CELL_SIZE // (4 * ANIMATION_FRAMES)
+    # Draw the first diagonal
+    for i in range(ANIMATION_FRAMES):
+        cv2.line(frame, (center[0] - line_step * i, center[1] - line_step * i),
+                 (center[0] - CELL_SIZE // 4, center[1] - CELL_SIZE // 4), X_COLOR, LINE_THICKNESS)
+        cv2.line(frame, (center[0] + CELL_SIZE // 4, center[1] + CELL_SIZE // 4),
+                 (center[0] + line_step * i, center[1] + line_step * i), X_COLOR, LINE_THICKNESS)
+        yield frame.copy()
+    # Draw the second diagonal
+    for i in range(ANIMATION_FRAMES):
+        cv2.line(frame, (center[0] + line_step * i, center[1] - line_step * i),
+                 (center[0] + CELL_SIZE // 4, center[1] - CELL_SIZE // 4), X_COLOR, LINE_THICKNESS)
+        cv2.line(frame, (center[0] - CELL_SIZE // 4, center[1] + CELL_SIZE // 4),
+                 (center[0] - line_step * i, center[1] + line_step * i), X_COLOR, LINE_THICKNESS)
+        yield frame.copy()
+
+def check_winner(board):
+    # Check rows and columns
+    for i in range(SIZE):
+        if all([board[i][j] == 'O' for j in range(SIZE)]) or all([board[i][j] == 'X' for j in range(SIZE)]):
+            return board[i][0]
+        if all([board[j][i] == 'O' for j in range(SIZE)]) or all([board[j][i] == 'X' for j in range(SIZE)]):
+            return board[0][i]
+
+    # Check diagonals
+    if all([board[i][i] == 'O' for i in range(SIZE)]) or all([board[i][i] == 'X' for i in range(SIZE)]):
+        return board[0][0]
+    if all([board[i][SIZE - i - 1] == 'O' for i in range(SIZE)]) or all([board[i][SIZE - i - 1] == 'X' for i in range(SIZE)]):
+        return board[0][SIZE - 1]
+
+    # Check draw
+    if all([cell != '' for row in board for cell in row]):
+        return 'Draw'
+
+    return None
+
+def random_move(board, player):
+    empty_cells = [(r, c) for r in range(SIZE) for c in range(SIZE) if board[r][c] == '']
+    if empty_cells:
+        r, c = random.choice(empty_cells)
+        board[r][c] = player
+        return r, c
+    return None, None
+
+def encode(cells):
+    # Base-3 number with one digit per cell
+    code = 0
+    for value in reversed(cells):
+        code = code * 3 + value
+    return code
+
+def canonical(cells):
+    # Smallest code among the 8 symmetric versions of the position, and the symmetry that gives it
+    return min((encode([cells[i] for i in perm]), perm) for perm in SYMMETRIES)
+
+def solve(cells, player, values, best_moves):
+    # Negamax over the whole game tree from a canonical position: 1 win, 0 draw, -1 loss for the player to move.
+    # best_moves keeps a 9-bit mask of every optimal move, so games can still vary.
+    code = encode(cells)
+    if code in values:
+        return values[code]
+    opponent = 3 - player
+    best_value, best_mask = -2, 0
+    for move in range(9):
+        if cells[move] != 0:
+            continue
+        cells[move] = player
+        if any(cells[a] == cells[b] == cells[c] == player for a, b, c in LINES):
+            value = 1
+        elif 0 not in cells:
+            value = 0
+        else:
+            _, perm = canonical(cells)
+            value = -solve([cells[i] for i in perm], opponent, values, best_moves)
+        cells[move] = 0
+        if value > best_value:
+            best_value, best_mask = value, 1 << move
+        elif value == best_value:
+            best_mask |= 1 << move
+    values[code] = best_value
+    best_moves[code] = best_mask
+    return best_value
+
+def load_perfect_table():
+    # Sorted canonical position codes and their optimal-move masks, solved once and kept on disk
+    if os.path.exists(table_filename):
+        with open(table_filename, 'rb') as f:
+            count = array('I')
+            count.fromfile(f, 1)
+            codes = array('I')
+            codes.fromfile(f, count[0])
+            masks = array('H')
+            masks.fromfile(f, count[0])
+        return codes, masks
+
+    values, best_moves = {}, {}
+    solve([0] * 9, PIECE_CODES['O'], values, best_moves)
+    codes = array('I', sorted(best_moves))
+    masks = array('H', [best_moves[code] for code in codes])
+    with open(table_filename, 'wb') as f:
+        array('I', [len(codes)]).tofile(f)
+        codes.tofile(f)
+        masks.tofile(f)
+    return codes, masks
+
+def perfect_move(board, player, table):
+    codes, masks = table
+    code, perm = canonical([PIECE_CODES[cell] for row in board for cell in row])
+    mask = masks[bisect_left(codes, code)]
+    # Map the optimal moves of the canonical position back onto the real board
+    moves = [perm[move] for move in range(9) if mask >> move & 1]
+    r, c = divmod(random.choice(moves), SIZE)
+    board[r][c] = player
+    return r, c
+
+def main():
+    table = load_perfect_table()
+    board = [['' for _ in range(SIZE)] for _ in range(SIZE)]
+    frame = np.ones((HEIGHT, WIDTH, 3), dtype=np.uint8) * 255
+    players = ['O', 'X']
+    current_player_index = 0
+
+    out = cv2.VideoWriter(filename, cv2.VideoWriter_fourcc(*'mp4v'), DRAW_FPS, (WIDTH, HEIGHT))
+
+    for _ in range(100):  # Assuming a maximum of 100 moves in 1 minute
+        draw_board(frame, board)
+        out.write(frame)
+
+        winner = check_winner(board)
+        if winner:
+            if winner == 'Draw':
+                text = "Draw! Restarting..."
+            else:
+                text = f"{winner} Wins! Restarting..."
+            text_size = cv2.getTextSize(text, FONT, 1.5, 3)[0]
+            text_x = (WIDTH - text_size[0]) // 2
+            text_y = (HEIGHT + text_size[1]) // 2
+            cv2.putText(frame, text, (text_x, text_y), FONT, 1.5, LINE_COLOR, 3, cv2.LINE_AA)
+            for _ in range(10):  # Shorter pause for the restart message
+                out.write(frame)
+            board = [['' for _ in range(SIZE)] for _ in range(SIZE)]  # Reset board
+            frame = np.ones((HEIGHT, WIDTH, 3), dtype=np.uint8) * 255  # Clear frame
+            current_player_index = 0
+        else:
+            if players[current_player_index] in PERFECT_PLAYERS:
+                row, col = perfect_move(board, players[current_player_index], table)
+            else:
+                row, col = random_move(board, players[current_player_index])
+            if row is not None and col is not None:
+                center = (margin_x + col * CELL_SIZE + CELL_SIZE // 2, 
+                          margin_y + row * CELL_SIZE + CELL_SIZE // 2)
+                if players[current_player_index] == 'O':
+                    for frame in animate_O(frame.copy(), center):
+                        out.write(frame)
+                else:
+                    for frame in animate_X(frame.copy(), center):
+                        out.write(frame)
+
+            current_player_index = (current_player_index + 1) % 2
+
+    out.release()
+    cv2.destroyAllWindows()
+
+if __name__ == "__main__":
+    main()
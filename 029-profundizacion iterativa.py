@@ -0,0 +1,716 @@
+import cv2
+import numpy as np
+import random
+import os
+import sys
+import time
+from collections import Counter
+from multiprocessing import Pool
+
+# Constants
+WIDTH, HEIGHT = 1920, 1080
+LINE_COLOR = (0, 0, 0)
+LINE_THICKNESS = 5
+O_COLOR = (255, 0, 0)
+X_COLOR = (0, 0, 255)
+STRIKE_THICKNESS = 10
+FONT = cv2.FONT_HERSHEY_SIMPLEX
+DRAW_FPS = 60  # Frames per second
+ANIMATION_FRAMES = 5  # Number of frames for each drawing animation
+VIDEO_DURATION = 60 * 60  # Duration of the video in seconds
+TOTAL_FRAMES = VIDEO_DURATION * DRAW_FPS  # Total frames for the video
+WIN_LENGTH = 3  # Pieces in a row needed to score
+
+# Headless mode: run with --headless to only simulate games and print statistics, without video
+HEADLESS = '--headless' in sys.argv
+SIMULATION_SIZES = range(10, 21)  # Board sizes to simulate
+SIMULATION_GAMES = 1000  # Games per board size
+
+# Monte Carlo mode: run with --montecarlo to spread seeded games over every core
+MONTE_CARLO = '--montecarlo' in sys.argv
+MASTER_SEED = 2024  # Every game seed is drawn from this one, so runs are reproducible
+CHUNK_GAMES = 250  # Games handed to a worker at a time
+
+# Alpha-beta player
+ALPHA_BETA_PLAYERS = ('O', 'X')  # Players that search instead of using random_move
+MAX_SEARCH_DEPTH = 12  # Deepest iteration tried per move
+SEARCH_WIDTH = 10  # Moves tried per position, best-ordered first
+TT_SIZE = 1 << 16  # Transposition table entries (a power of two)
+ZOBRIST_SEED = 7
+POINT = 100  # Search value of one struck line
+INFINITY = 1 << 30
+EXACT, LOWER, UPPER = 0, 1, 2  # Kinds of transposition table values
+
+# Each move is shown for ANIMATION_FRAMES frames, so searching for longer than that screen time
+# would make the render slower than the video itself. The search may use a share of it.
+SEARCH_BUDGET_SHARE = 0.5  # Drawing and encoding need the rest
+SEARCH_TIME_BUDGET = ANIMATION_FRAMES / DRAW_FPS * SEARCH_BUDGET_SHARE  # Seconds per move
+SIMULATION_SEARCH_NODES = 200  # Node budget per move in simulations, used instead of SEARCH_TIME_BUDGET so
+                               # results only depend on the seeds, not on the machine or its load
+SEARCH_REPORT = '--report' in sys.argv  # Print depth reached and nodes/sec for every move
+
+# Ensure render directory exists
+if not os.path.exists('render'):
+    os.makedirs('render')
+
+# Get epoch time for filename
+epoch_time = int(time.time())
+filename = f'render/tic_tac_toe_animated_{epoch_time}.mp4'
+
+
+def calculate_margins_and_cell_size(SIZE):
+    max_cell_size = min(WIDTH, HEIGHT) // SIZE - LINE_THICKNESS
+    margin_x = (WIDTH - (max_cell_size * SIZE)) // 2
+    margin_y = (HEIGHT - (max_cell_size * SIZE)) // 2
+    return margin_x, margin_y, max_cell_size
+
+
+def build_window_table(SIZE, length=WIN_LENGTH):
+    # Every line of 'length' cells on the board (rows, columns and all diagonals in both
+    # directions), plus the ids of the windows each cell belongs to. Built once per board size.
+    windows = []
+    cell_windows = {(r, c): [] for r in range(SIZE) for c in range(SIZE)}
+    for dr, dc in ((0, 1), (1, 0), (1, 1), (1, -1)):
+        for r in range(SIZE):
+            for c in range(SIZE):
+                end_r, end_c = r + (length - 1) * dr, c + (length - 1) * dc
+                if 0 <= end_r < SIZE and 0 <= end_c < SIZE:
+                    window = tuple((r + i * dr, c + i * dc) for i in range(length))
+                    for cell in window:
+                        cell_windows[cell].append(len(windows))
+                    windows.append(window)
+    return {'windows': windows, 'cell_windows': cell_windows}
+
+
+def draw_board(frame, board, margin_x, margin_y, CELL_SIZE, used_cells):
+    SIZE = len(board)
+    for i in range(1, SIZE):
+        # Horizontal lines
+        cv2.line(frame, (margin_x, margin_y + i * CELL_SIZE),
+                 (margin_x + CELL_SIZE * SIZE, margin_y + i * CELL_SIZE), LINE_COLOR, LINE_THICKNESS)
+        # Vertical lines
+        cv2.line(frame, (margin_x + i * CELL_SIZE, margin_y),
+                 (margin_x + i * CELL_SIZE, margin_y + CELL_SIZE * SIZE), LINE_COLOR, LINE_THICKNESS)
+
+    for row in range(SIZE):
+        for col in range(SIZE):
+            center = (margin_x + col * CELL_SIZE + CELL_SIZE // 2,
+                      margin_y + row * CELL_SIZE + CELL_SIZE // 2)
+            if board[row][col] == 'O':
+                cv2.circle(frame, center, CELL_SIZE // 3, O_COLOR, LINE_THICKNESS)
+            elif board[row][col] == 'X':
+                cv2.line(frame, (center[0] - CELL_SIZE // 4, center[1] - CELL_SIZE // 4),
+                         (center[0] + CELL_SIZE // 4, center[1] + CELL_SIZE // 4), X_COLOR, LINE_THICKNESS)
+                cv2.line(frame, (center[0] + CELL_SIZE // 4, center[1] - CELL_SIZE // 4),
+                         (center[0] - CELL_SIZE // 4, center[1] + CELL_SIZE // 4), X_COLOR, LINE_THICKNESS)
+            if used_cells[row][col]:
+                cv2.rectangle(frame, (margin_x + col * CELL_SIZE, margin_y + row * CELL_SIZE),
+                              (margin_x + (col + 1) * CELL_SIZE, margin_y + (row + 1) * CELL_SIZE),
+                              (0, 255, 0), 3)
+
+
+def animate_O(frame, center, CELL_SIZE):
+    for i in range(ANIMATION_FRAMES):
+        angle = int(360 * i / ANIMATION_FRAMES)
+        axes = (CELL_SIZE // 3, CELL_SIZE // 3)
+        cv2.ellipse(frame, center, axes, 0, 0, angle, O_COLOR, LINE_THICKNESS)
+        yield frame.copy()
+
+
+def animate_X(frame, center, CELL_SIZE):
+    line_step = CELL_SIZE // (4 * ANIMATION_FRAMES)
+    # Draw the first diagonal
+    for i in range(ANIMATION_FRAMES):
+        cv2.line(frame, (center[0] - line_step * i, center[1] - line_step * i),
+                 (center[0] - CELL_SIZE // 4, center[1] - CELL_SIZE // 4), X_COLOR, LINE_THICKNESS)
+        cv2.line(frame, (center[0] + CELL_SIZE // 4, center[1] + CELL_SIZE // 4),
+                 (center[0] + line_step * i, center[1] + line_step * i), X_COLOR, LINE_THICKNESS)
+        yield frame.copy()
+    # Draw the second diagonal
+    for i in range(ANIMATION_FRAMES):
+        cv2.line(frame, (center[0] + line_step * i, center[1] - line_step * i),
+                 (center[0] + CELL_SIZE // 4, center[1] - CELL_SIZE // 4), X_COLOR, LINE_THICKNESS)
+        cv2.line(frame, (center[0] - CELL_SIZE // 4, center[1] + CELL_SIZE // 4),
+                 (center[0] - line_step * i, center[1] + line_step * i), X_COLOR, LINE_THICKNESS)
+        yield frame.copy()
+
+
+def check_winner(board, used_cells, last_move, window_table):
+    # Only the windows that contain the last placed piece can have been completed by it
+    if last_move is None:
+        return None, None
+    r, c = last_move
+    player = board[r][c]
+    if player == '' or used_cells[r][c]:
+        return None, None
+
+    windows = window_table['windows']
+    for window_id in window_table['cell_windows'][last_move]:
+        window = windows[window_id]
+        if all(board[wr][wc] == player and not used_cells[wr][wc] for wr, wc in window):
+            return player, window
+
+    return None, None
+
+
+def draw_strike_line(frame, margin_x, margin_y, CELL_SIZE, win_info, color):
+    # Run the line from the outer edge of the first cell to the outer edge of the last one
+    (first_r, first_c), (last_r, last_c) = win_info[0], win_info[-1]
+    dr = (last_r - first_r) // (len(win_info) - 1)
+    dc = (last_c - first_c) // (len(win_info) - 1)
+    start_point = (margin_x + first_c * CELL_SIZE + CELL_SIZE // 2 - dc * CELL_SIZE // 2,
+                   margin_y + first_r * CELL_SIZE + CELL_SIZE // 2 - dr * CELL_SIZE // 2)
+    end_point = (margin_x + last_c * CELL_SIZE + CELL_SIZE // 2 + dc * CELL_SIZE // 2,
+                 margin_y + last_r * CELL_SIZE + CELL_SIZE // 2 + dr * CELL_SIZE // 2)
+
+    cv2.line(frame, start_point, end_point, color, STRIKE_THICKNESS)
+
+
+def window_threat(board, used_cells, window):
+    # A window is a threat when all its cells but one hold pieces of the same player, none of them used
+    if any(used_cells[r][c] for r, c in window):
+        return None
+    values = [board[r][c] for r, c in window]
+    if values.count('') != 1:
+        return None
+    pieces = set(values)
+    pieces.discard('')
+    if len(pieces) != 1:
+        return None
+    return pieces.pop(), window[values.index('')]
+
+
+# Threat index: for each player, the empty cells that would complete one of their windows,
+# with how many windows each cell completes. Kept up to date on every placement and strike.
+def update_threats(threats, board, used_cells, window_table, window_ids, delta):
+    for window_id in window_ids:
+        threat = window_threat(board, used_cells, window_table['windows'][window_id])
+        if threat:
+            player, cell = threat
+            threats[player][cell] = threats[player].get(cell, 0) + delta
+            if not threats[player][cell]:
+                del threats[player][cell]
+
+
+# Free-cell pool: the first 'count' entries of 'cells' are the empty cells, 'index' gives
+# the position of each cell in 'cells'. Taking a cell swaps it to the end of the free part.
+def new_free_pool(SIZE):
+    cells = [(r, c) for r in range(SIZE) for c in range(SIZE)]
+    return {'cells': cells, 'index': {cell: i for i, cell in enumerate(cells)}, 'count': len(cells)}
+
+
+def take_free_cell(free_pool, cell):
+    cells, index = free_pool['cells'], free_pool['index']
+    i = index[cell]
+    last = free_pool['count'] - 1
+    other = cells[last]
+    cells[i], cells[last] = other, cell
+    index[other], index[cell] = i, last
+    free_pool['count'] = last
+
+
+def reset_free_pool(free_pool):
+    # Every taken cell sits after 'count', so restoring the counter frees them all
+    free_pool['count'] = len(free_pool['cells'])
+
+
+def place_piece(board, used_cells, window_table, threats, free_pool, row, col, player):
+    window_ids = window_table['cell_windows'][(row, col)]
+    update_threats(threats, board, used_cells, window_table, window_ids, -1)
+    board[row][col] = player
+    take_free_cell(free_pool, (row, col))
+    update_threats(threats, board, used_cells, window_table, window_ids, 1)
+
+
+def strike_cells(board, used_cells, window_table, threats, cells):
+    # Struck cells already hold pieces, so the free-cell pool does not change here
+    window_ids = set()
+    for cell in cells:
+        window_ids.update(window_table['cell_windows'][cell])
+    update_threats(threats, board, used_cells, window_table, window_ids, -1)
+    for r, c in cells:
+        used_cells[r][c] = True
+    update_threats(threats, board, used_cells, window_table, window_ids, 1)
+
+
+def random_move(board, player, opponent, used_cells, threats, free_pool, rng=random):
+    if not free_pool['count']:
+        return None, None
+
+    # Check if player can win (first cell in board order, as a full scan would find it)
+    if threats[player]:
+        return min(threats[player])
+
+    # Check if opponent can win and block
+    if threats[opponent]:
+        return min(threats[opponent])
+
+    # No immediate win or block, choose random
+    return free_pool['cells'][rng.randrange(free_pool['count'])]
+
+
+def remove_piece(board, used_cells, window_table, threats, free_pool, row, col):
+    # Undo of place_piece: the cell was the last one taken, so it sits right after the free part of the pool
+    window_ids = window_table['cell_windows'][(row, col)]
+    update_threats(threats, board, used_cells, window_table, window_ids, -1)
+    board[row][col] = ''
+    free_pool['count'] += 1
+    update_threats(threats, board, used_cells, window_table, window_ids, 1)
+
+
+def unstrike_cells(board, used_cells, window_table, threats, cells):
+    # Undo of strike_cells
+    window_ids = set()
+    for cell in cells:
+        window_ids.update(window_table['cell_windows'][cell])
+    update_threats(threats, board, used_cells, window_table, window_ids, -1)
+    for r, c in cells:
+        used_cells[r][c] = False
+    update_threats(threats, board, used_cells, window_table, window_ids, 1)
+
+
+def new_search(SIZE, node_budget=None):
+    # Zobrist keys (one random 64-bit number per piece or used mark on each cell, plus one
+    # for the side to move) and a fixed-size transposition table, kept across the moves of a game.
+    # node_budget None: each move searches for SEARCH_TIME_BUDGET seconds, else for that many nodes.
+    rng = random.Random(ZOBRIST_SEED)
+    cells = [(r, c) for r in range(SIZE) for c in range(SIZE)]
+    zobrist = {kind: {cell: rng.getrandbits(64) for cell in cells} for kind in ('O', 'X', 'used')}
+    zobrist['side'] = rng.getrandbits(64)
+    # 'totals' keeps running sums over every search, for the averages in the reports
+    return {'zobrist': zobrist, 'table': [None] * TT_SIZE, 'generation': 0, 'nodes': 0, 'deadline': None,
+            'node_budget': node_budget, 'max_nodes': None,
+            'totals': {'searches': 0, 'depth': 0, 'nodes': 0, 'time': 0.0}}
+
+
+def position_key(board, used_cells, zobrist, player):
+    key = zobrist['side'] if player == 'X' else 0
+    for r, row in enumerate(board):
+        for c, cell in enumerate(row):
+            if cell != '':
+                key ^= zobrist[cell][(r, c)]
+            if used_cells[r][c]:
+                key ^= zobrist['used'][(r, c)]
+    return key
+
+
+# The key is the position only, not the 'recent' moves that ordered_moves uses to pick its
+# SEARCH_WIDTH candidates. So an entry reached through another move order holds a value
+# searched over slightly different candidates: an accepted approximation, as adding 'recent'
+# to the key would make those transpositions miss the table.
+def tt_store(search, key, depth, value, flag, move):
+    # Replace an entry from an earlier move, or one searched less deep than this one
+    index = key & (TT_SIZE - 1)
+    entry = search['table'][index]
+    if entry is None or entry[5] != search['generation'] or depth >= entry[1]:
+        search['table'][index] = (key, depth, value, flag, move, search['generation'])
+
+
+def make_move(state, row, col, player):
+    # Place a piece inside the search and strike the window it completes, if any
+    board, used_cells, window_table = state['board'], state['used_cells'], state['window_table']
+    zobrist = state['search']['zobrist']
+    place_piece(board, used_cells, window_table, state['threats'], state['free_pool'], row, col, player)
+    state['key'] ^= zobrist[player][(row, col)] ^ zobrist['side']
+    winner, win_info = check_winner(board, used_cells, (row, col), window_table)
+    if winner:
+        strike_cells(board, used_cells, window_table, state['threats'], win_info)
+        for cell in win_info:
+            state['key'] ^= zobrist['used'][cell]
+    return win_info
+
+
+def unmake_move(state, row, col, player, win_info):
+    board, used_cells, window_table = state['board'], state['used_cells'], state['window_table']
+    zobrist = state['search']['zobrist']
+    if win_info:
+        unstrike_cells(board, used_cells, window_table, state['threats'], win_info)
+        for cell in win_info:
+            state['key'] ^= zobrist['used'][cell]
+    remove_piece(board, used_cells, window_table, state['threats'], state['free_pool'], row, col)
+    state['key'] ^= zobrist[player][(row, col)] ^ zobrist['side']
+
+
+def ordered_moves(state, player, opponent, tt_move, recent):
+    # Best move from the transposition table first, then cells that score, cells that block,
+    # and the free cells in the windows around the latest moves
+    board, used_cells, window_table = state['board'], state['used_cells'], state['window_table']
+    moves = []
+    if tt_move is not None and board[tt_move[0]][tt_move[1]] == '':
+        moves.append(tt_move)
+    moves.extend(sorted(state['threats'][player]))
+    moves.extend(sorted(state['threats'][opponent]))
+    for cell in recent:
+        for window_id in window_table['cell_windows'][cell]:
+            for r, c in window_table['windows'][window_id]:
+                if board[r][c] == '' and not used_cells[r][c]:
+                    moves.append((r, c))
+    return list(dict.fromkeys(moves))[:SEARCH_WIDTH]
+
+
+def evaluate(state, player, opponent):
+    # Static guess of the points still to come: an open threat is very likely a point next turn
+    mine, theirs = state['threats'][player], state['threats'][opponent]
+    return (POINT * 8 // 10 if mine else 0) + POINT // 10 * (len(mine) - len(theirs))
+
+
+class SearchTimeout(Exception):
+    # The move ran out of time, or of nodes in simulations
+    pass
+
+
+def alpha_beta(state, player, opponent, depth, alpha, beta, recent):
+    # Negamax with alpha-beta pruning. Returns (points for player minus points for opponent from here on, best move).
+    if not state['free_pool']['count']:
+        return 0, None
+    if depth == 0:
+        return evaluate(state, player, opponent), None
+    search = state['search']
+    search['nodes'] += 1
+    if search['deadline'] is not None and time.perf_counter() >= search['deadline']:
+        raise SearchTimeout
+    if search['max_nodes'] is not None and search['nodes'] > search['max_nodes']:
+        raise SearchTimeout
+
+    key = state['key']
+    entry = search['table'][key & (TT_SIZE - 1)]
+    tt_move = None
+    if entry is not None and entry[0] == key:
+        _, entry_depth, entry_value, entry_flag, tt_move, _ = entry
+        if entry_depth >= depth:
+            if entry_flag == EXACT:
+                return entry_value, tt_move
+            elif entry_flag == LOWER:
+                alpha = max(alpha, entry_value)
+            elif entry_flag == UPPER:
+                beta = min(beta, entry_value)
+            if alpha >= beta:
+                return entry_value, tt_move
+
+    moves = ordered_moves(state, player, opponent, tt_move, recent)
+    if not moves:
+        return evaluate(state, player, opponent), None
+
+    alpha_start = alpha
+    best_value, best_move = -INFINITY, None
+    for row, col in moves:
+        win_info = make_move(state, row, col, player)
+        try:
+            value = (POINT if win_info else 0) - alpha_beta(state, opponent, player, depth - 1, -beta, -alpha,
+                                                             ((row, col),) + recent[:1])[0]
+        finally:
+            # Also when the deadline unwinds the search, so the board is always left as it was
+            unmake_move(state, row, col, player, win_info)
+        if value > best_value:
+            best_value, best_move = value, (row, col)
+        alpha = max(alpha, value)
+        if alpha >= beta:
+            break
+
+    if best_value <= alpha_start:
+        flag = UPPER
+    elif best_value >= beta:
+        flag = LOWER
+    else:
+        flag = EXACT
+    tt_store(search, key, depth, best_value, flag, best_move)
+    return best_value, best_move
+
+
+def alpha_beta_move(board, player, opponent, used_cells, threats, free_pool, window_table, search, recent, rng=random):
+    # Iterative deepening: search depth 1, 2, 3... until SEARCH_TIME_BUDGET (or the node budget)
+    # runs out, and play the best move of the deepest search that finished. Each pass orders its
+    # moves with the table entries left by the one before.
+    if not free_pool['count']:
+        return None, None
+    state = {'board': board, 'used_cells': used_cells, 'threats': threats, 'free_pool': free_pool,
+             'window_table': window_table, 'search': search,
+             'key': position_key(board, used_cells, search['zobrist'], player)}
+    search['generation'] += 1
+    search['nodes'] = 0
+    start_time = time.perf_counter()
+    node_budget = search['node_budget']
+    deadline = start_time + SEARCH_TIME_BUDGET if node_budget is None else None
+
+    move = None
+    depth_reached = 0
+    for depth in range(1, MAX_SEARCH_DEPTH + 1):
+        # Depth 1 always finishes, so there is always a move to play
+        search['deadline'] = deadline if depth > 1 else None
+        search['max_nodes'] = node_budget if depth > 1 else None
+        try:
+            _, depth_move = alpha_beta(state, player, opponent, depth, -INFINITY, INFINITY, recent)
+        except SearchTimeout:
+            break
+        depth_reached = depth
+        if depth_move is not None:
+            move = depth_move
+        if deadline is not None and time.perf_counter() >= deadline:
+            break
+        if node_budget is not None and search['nodes'] >= node_budget:
+            break
+    search['deadline'] = search['max_nodes'] = None
+
+    elapsed = time.perf_counter() - start_time
+    totals = search['totals']
+    totals['searches'] += 1
+    totals['depth'] += depth_reached
+    totals['nodes'] += search['nodes']
+    totals['time'] += elapsed
+    if SEARCH_REPORT:
+        nodes_per_second = search['nodes'] / elapsed if elapsed else 0.0
+        print(f"{player}: depth {depth_reached}, {search['nodes']} nodes, {nodes_per_second:.0f} nodes/s, "
+              f"{elapsed * 1000:.1f} ms | average depth {totals['depth'] / totals['searches']:.2f}, "
+              f"{totals['nodes'] / totals['time'] if totals['time'] else 0.0:.0f} nodes/s")
+
+    if move is None:
+        # Nothing on the board to look at yet, open anywhere
+        return free_pool['cells'][rng.randrange(free_pool['count'])]
+    return move
+
+
+def draw_text_with_capsule(frame, text, font, font_scale, thickness, position, text_color, capsule_color, capsule_padding=20):
+    text_size = cv2.getTextSize(text, font, font_scale, thickness)[0]
+    text_x, text_y = position
+
+    # Calculate capsule dimensions
+    capsule_width = text_size[0] + capsule_padding * 2
+    capsule_height = text_size[1] + capsule_padding * 2
+    capsule_top_left = (text_x - capsule_padding, text_y - text_size[1] - capsule_padding)
+    capsule_bottom_right = (text_x + text_size[0] + capsule_padding, text_y + capsule_padding)
+
+    # Draw the capsule (rounded rectangle)
+    radius = int(capsule_height / 2)
+    cv2.rectangle(frame, capsule_top_left, capsule_bottom_right, capsule_color, -1, lineType=cv2.LINE_AA)
+    cv2.circle(frame, (capsule_top_left[0] + radius, capsule_top_left[1] + radius), radius, capsule_color, -1, lineType=cv2.LINE_AA)
+    cv2.circle(frame, (capsule_bottom_right[0] - radius, capsule_top_left[1] + radius), radius, capsule_color, -1, lineType=cv2.LINE_AA)
+
+    # Draw the text
+    cv2.putText(frame, text, position, font, font_scale, text_color, thickness, cv2.LINE_AA)
+
+
+def play_game(SIZE, window_table, free_pool, search, rng=random):
+    # Plays one game and yields what happens, so it can be rendered or just counted:
+    # ('start', board, used_cells), ('strike', winner, win_info), ('move', player, row, col), ('game_over', score)
+    board = [['' for _ in range(SIZE)] for _ in range(SIZE)]
+    used_cells = [[False for _ in range(SIZE)] for _ in range(SIZE)]
+    threats = {'O': {}, 'X': {}}
+    reset_free_pool(free_pool)
+    search['table'] = [None] * TT_SIZE  # Nothing from the last game carries over
+    players = ['O', 'X']
+    current_player_index = 0
+    last_move = None
+    recent = ()
+    score = {'O': 0, 'X': 0}
+
+    yield 'start', board, used_cells
+
+    while True:
+        winner, win_info = check_winner(board, used_cells, last_move, window_table)
+        if winner:
+            strike_cells(board, used_cells, window_table, threats, win_info)
+            score[winner] += 1  # Increment score
+            yield 'strike', winner, win_info
+
+        player = players[current_player_index]
+        opponent = players[(current_player_index + 1) % 2]
+
+        if player in ALPHA_BETA_PLAYERS:
+            row, col = alpha_beta_move(board, player, opponent, used_cells, threats, free_pool, window_table, search, recent, rng)
+        else:
+            row, col = random_move(board, player, opponent, used_cells, threats, free_pool, rng)
+        if row is not None and col is not None:
+            place_piece(board, used_cells, window_table, threats, free_pool, row, col, player)
+            last_move = (row, col)
+            recent = (last_move,) + recent[:1]
+            yield 'move', player, row, col
+
+        current_player_index = (current_player_index + 1) % 2
+
+        # Check if the board is full
+        if not free_pool['count']:
+            yield 'game_over', score
+            return
+
+
+def main():
+    SIZE = random.randint(15, 20)  # Randomize the size of the board at the start
+    margin_x, margin_y, CELL_SIZE = calculate_margins_and_cell_size(SIZE)
+    window_table = build_window_table(SIZE)
+    free_pool = new_free_pool(SIZE)
+    search = new_search(SIZE)
+
+    out = cv2.VideoWriter(filename, cv2.VideoWriter_fourcc(*'mp4v'), DRAW_FPS, (WIDTH, HEIGHT))
+
+    frame_count = 0
+
+    while frame_count < TOTAL_FRAMES:
+        for event in play_game(SIZE, window_table, free_pool, search):
+            if event[0] == 'start':
+                _, board, used_cells = event
+                frame = np.ones((HEIGHT, WIDTH, 3), dtype=np.uint8) * 255  # Clear frame
+                draw_board(frame, board, margin_x, margin_y, CELL_SIZE, used_cells)
+                out.write(frame)
+                frame_count += 1
+
+            elif event[0] == 'strike':
+                _, winner, win_info = event
+                color = O_COLOR if winner == 'O' else X_COLOR
+                draw_strike_line(frame, margin_x, margin_y, CELL_SIZE, win_info, color)
+
+                for _ in range(DRAW_FPS):  # Pause briefly to show the strike
+                    if frame_count >= TOTAL_FRAMES:
+                        break
+                    out.write(frame)
+                    frame_count += 1
+
+            elif event[0] == 'move':
+                _, player, row, col = event
+                center = (margin_x + col * CELL_SIZE + CELL_SIZE // 2,
+                          margin_y + row * CELL_SIZE + CELL_SIZE // 2)
+                if player == 'O':
+                    for frame in animate_O(frame.copy(), center, CELL_SIZE):
+                        if frame_count >= TOTAL_FRAMES:
+                            break
+                        out.write(frame)
+                        frame_count += 1
+                else:
+                    for frame in animate_X(frame.copy(), center, CELL_SIZE):
+                        if frame_count >= TOTAL_FRAMES:
+                            break
+                        out.write(frame)
+                        frame_count += 1
+
+                if frame_count < TOTAL_FRAMES:
+                    draw_board(frame, board, margin_x, margin_y, CELL_SIZE, used_cells)
+                    out.write(frame)
+                    frame_count += 1
+
+            elif event[0] == 'game_over':
+                _, score = event
+                text = f"Game Over! O: {score['O']} - X: {score['X']}"
+                draw_text_with_capsule(frame, text, FONT, 1.5, 3, ((WIDTH - cv2.getTextSize(text, FONT, 1.5, 3)[0][0]) // 2,
+                                                                  (HEIGHT + cv2.getTextSize(text, FONT, 1.5, 3)[0][1]) // 2), LINE_COLOR, (255, 255, 255))
+                for _ in range(DRAW_FPS * 2):  # Pause to show the final score
+                    if frame_count >= TOTAL_FRAMES:
+                        break
+                    out.write(frame)
+                    frame_count += 1
+
+            if frame_count >= TOTAL_FRAMES:
+                break
+
+    out.release()
+    cv2.destroyAllWindows()
+
+
+def simulate():
+    # Same games as main(), without drawing or encoding anything
+    for SIZE in SIMULATION_SIZES:
+        window_table = build_window_table(SIZE)
+        free_pool = new_free_pool(SIZE)
+        search = new_search(SIZE, SIMULATION_SEARCH_NODES)
+        total_strikes = total_moves = 0
+        total_score = {'O': 0, 'X': 0}
+        results = {'O': 0, 'X': 0, 'Draw': 0}
+
+        start_time = time.time()
+        for _ in range(SIMULATION_GAMES):
+            for event in play_game(SIZE, window_table, free_pool, search):
+                if event[0] == 'strike':
+                    total_strikes += 1
+                elif event[0] == 'move':
+                    total_moves += 1
+                elif event[0] == 'game_over':
+                    score = event[1]
+            total_score['O'] += score['O']
+            total_score['X'] += score['X']
+            if score['O'] == score['X']:
+                results['Draw'] += 1
+            else:
+                results['O' if score['O'] > score['X'] else 'X'] += 1
+        elapsed = time.time() - start_time
+
+        games = SIMULATION_GAMES
+        print(f"SIZE {SIZE}: {games / elapsed:.1f} games/s | "
+              f"strikes/game {total_strikes / games:.2f} | moves/game {total_moves / games:.1f} | "
+              f"score O {total_score['O'] / games:.2f} - X {total_score['X'] / games:.2f} | "
+              f"wins O {100 * results['O'] / games:.1f}% X {100 * results['X'] / games:.1f}% "
+              f"draws {100 * results['Draw'] / games:.1f}%")
+
+
+def simulate_chunk(task):
+    # Worker: plays one seeded game per seed and returns the histograms for the chunk
+    SIZE, seeds = task
+    window_table = build_window_table(SIZE)
+    search = new_search(SIZE, SIMULATION_SEARCH_NODES)
+    stats = {'score': Counter(), 'strikes': Counter(), 'moves': Counter(), 'winner': Counter()}
+
+    for seed in seeds:
+        rng = random.Random(seed)
+        free_pool = new_free_pool(SIZE)  # Fresh cell order, so a game does not depend on the one before it
+        strikes = moves = 0
+        for event in play_game(SIZE, window_table, free_pool, search, rng):
+            if event[0] == 'strike':
+                strikes += 1
+            elif event[0] == 'move':
+                moves += 1
+            elif event[0] == 'game_over':
+                score = event[1]
+        stats['score'][(score['O'], score['X'])] += 1
+        stats['strikes'][strikes] += 1
+        stats['moves'][moves] += 1
+        # 'O' always moves first
+        if score['O'] == score['X']:
+            stats['winner']['Draw'] += 1
+        else:
+            stats['winner']['first' if score['O'] > score['X'] else 'second'] += 1
+
+    return SIZE, stats
+
+
+def histogram_mean(histogram):
+    return sum(value * count for value, count in histogram.items()) / sum(histogram.values())
+
+
+def simulate_parallel():
+    # The seeds depend only on MASTER_SEED and the merged histograms do not depend on the
+    # order chunks finish in, so the report is the same whatever the number of cores
+    master = random.Random(MASTER_SEED)
+    tasks = []
+    for SIZE in SIMULATION_SIZES:
+        seeds = [master.getrandbits(64) for _ in range(SIMULATION_GAMES)]
+        for i in range(0, len(seeds), CHUNK_GAMES):
+            tasks.append((SIZE, seeds[i:i + CHUNK_GAMES]))
+
+    merged = {SIZE: {'score': Counter(), 'strikes': Counter(), 'moves': Counter(), 'winner': Counter()}
+              for SIZE in SIMULATION_SIZES}
+    start_time = time.time()
+    with Pool(os.cpu_count()) as pool:
+        for SIZE, stats in pool.imap_unordered(simulate_chunk, tasks):
+            for name, histogram in stats.items():
+                merged[SIZE][name].update(histogram)
+    elapsed = time.time() - start_time
+
+    games = SIMULATION_GAMES
+    print(f"{games * len(merged)} games on {os.cpu_count()} cores in {elapsed:.1f}s "
+          f"({games * len(merged) / elapsed:.1f} games/s), master seed {MASTER_SEED}")
+    for SIZE, stats in merged.items():
+        score_o = sum(o * count for (o, _), count in stats['score'].items()) / games
+        score_x = sum(x * count for (_, x), count in stats['score'].items()) / games
+        print(f"SIZE {SIZE}: strikes/game {histogram_mean(stats['strikes']):.2f} "
+              f"(min {min(stats['strikes'])}, max {max(stats['strikes'])}) | "
+              f"moves/game {histogram_mean(stats['moves']):.1f} | score O {score_o:.2f} - X {score_x:.2f} | "
+              f"first mover wins {100 * stats['winner']['first'] / games:.1f}% "
+              f"loses {100 * stats['winner']['second'] / games:.1f}% "
+              f"draws {100 * stats['winner']['Draw'] / games:.1f}% | "
+              f"most common score {stats['score'].most_common(1)[0][0]}")
+
+
+if __name__ == "__main__":
+    if MONTE_CARLO:
+        simulate_parallel()
+    elif HEADLESS:
+        simulate()
+    else:
+        main()
@@ -0,0 +1,536 @@
+import cv2
+import numpy as np
+import random
+import os
+import struct
+import sys
+import time
+
+# Constants
+WIDTH, HEIGHT = 1920, 1080
+LINE_COLOR = (0, 0, 0)
+LINE_THICKNESS = 5
+O_COLOR = (255, 0, 0)
+X_COLOR = (0, 0, 255)
+STRIKE_THICKNESS = 10
+FONT = cv2.FONT_HERSHEY_SIMPLEX
+DRAW_FPS = 60  # Frames per second
+ANIMATION_FRAMES = 5  # Number of frames for each drawing animation
+VIDEO_DURATION = 60 * 60  # Duration of the video in seconds
+TOTAL_FRAMES = VIDEO_DURATION * DRAW_FPS  # Total frames for the video
+BOARD_SIZES = (15, 20)  # Smallest and largest board size, picked at random at the start
+WIN_LENGTH = 3  # Pieces in a row needed to score, e.g. 5 on a 19x19 board for gomoku.
+                # None means a whole row, column or diagonal, as in 001-013.
+
+# Cell flags in GameState.cells
+PIECE_O = 1
+PIECE_X = 2
+USED = 4  # Part of a struck line
+PIECE_MASK = PIECE_O | PIECE_X
+SYMBOLS = ('', 'O', 'X')  # Indexed by piece code
+
+# Headless mode: run with --headless to only simulate games and print statistics, without video
+HEADLESS = '--headless' in sys.argv
+SIMULATION_SIZES = range(10, 21)  # Board sizes to simulate
+SIMULATION_GAMES = 1000  # Games per board size
+
+# Move log: every render writes the games it plays to a binary log; run with --replay <log> to render
+# those same games again (e.g. with other colours or resolution) without running any game logic
+REPLAY_LOG = None
+if '--replay' in sys.argv:
+    replay_arg = sys.argv.index('--replay') + 1
+    if replay_arg == len(sys.argv) or sys.argv[replay_arg].startswith('--'):
+        sys.exit(f"usage: {sys.argv[0]} [--headless] [--replay <log>]")
+    REPLAY_LOG = sys.argv[replay_arg]
+LOG_MAGIC = b'TTTL'
+LOG_HEADER = struct.Struct('<4sIBB')  # Magic, seed, SIZE, WIN_LENGTH (0 for a whole line)
+LOG_RECORD = struct.Struct('<H')  # One record per move, strike or game over: 2 bits of kind, 14 bits of value
+RECORD_O = 0 << 14  # Value: cell index, row * SIZE + col
+RECORD_X = 1 << 14
+RECORD_STRIKE = 2 << 14  # Value: window id in the window table
+RECORD_GAME_OVER = 3 << 14
+RECORD_KIND = 3 << 14
+RECORD_VALUE = (1 << 14) - 1
+
+# Ensure render directory exists
+if not os.path.exists('render'):
+    os.makedirs('render')
+
+# Get epoch time for filename
+epoch_time = int(time.time())
+filename = f'render/tic_tac_toe_animated_{epoch_time}.mp4'
+log_filename = f'render/tic_tac_toe_moves_{epoch_time}.bin'
+
+
+def calculate_margins_and_cell_size(SIZE):
+    max_cell_size = min(WIDTH, HEIGHT) // SIZE - LINE_THICKNESS
+    margin_x = (WIDTH - (max_cell_size * SIZE)) // 2
+    margin_y = (HEIGHT - (max_cell_size * SIZE)) // 2
+    return margin_x, margin_y, max_cell_size
+
+
+def build_window_table(SIZE, length=WIN_LENGTH):
+    # Every line of 'length' cells on the board (rows, columns and all diagonals in both
+    # directions), plus the ids of the windows each cell belongs to. Built once per board size.
+    windows = []
+    cell_windows = {(r, c): [] for r in range(SIZE) for c in range(SIZE)}
+    for dr, dc in ((0, 1), (1, 0), (1, 1), (1, -1)):
+        for r in range(SIZE):
+            for c in range(SIZE):
+                end_r, end_c = r + (length - 1) * dr, c + (length - 1) * dc
+                if 0 <= end_r < SIZE and 0 <= end_c < SIZE:
+                    window = tuple((r + i * dr, c + i * dc) for i in range(length))
+                    for cell in window:
+                        cell_windows[cell].append(len(windows))
+                    windows.append(window)
+    return {'windows': windows, 'cell_windows': cell_windows, 'length': length}
+
+
+class GameState:
+    # The whole game in storage allocated once per board size: one flag byte per cell, running piece
+    # and used-cell counts per window, the threat index, the free-cell pool and an undo stack.
+    # Moves, strikes, their undo and reset() all work in place.
+    __slots__ = ('size', 'length', 'windows', 'window_cells', 'cell_windows', 'cells', 'blank', 'counts',
+                 'used_counts', 'zeros', 'threats', 'free_cells', 'free_index', 'free_count', 'score',
+                 'undo', 'depth')
+
+    def __init__(self, SIZE, length=WIN_LENGTH):
+        window_table = build_window_table(SIZE, length)
+        n = SIZE * SIZE
+        self.size = SIZE
+        self.length = length
+        self.windows = window_table['windows']  # Cells of each window as (row, col), for drawing
+        self.window_cells = [tuple(r * SIZE + c for r, c in window) for window in self.windows]
+        self.cell_windows = [window_table['cell_windows'][divmod(cell, SIZE)] for cell in range(n)]
+        self.cells = bytearray(n)
+        self.blank = bytes(n)
+        windows = len(self.windows)
+        self.counts = (None, [0] * windows, [0] * windows)  # Pieces in every window, by piece code
+        self.used_counts = [0] * windows
+        self.zeros = [0] * windows
+        # Threat index: for each player, the empty cells that would complete one of their windows,
+        # with how many windows each cell completes
+        self.threats = (None, {}, {})
+        # Free-cell pool: the first 'free_count' entries of 'free_cells' are the empty cells,
+        # 'free_index' gives the position of each cell in 'free_cells'
+        self.free_cells = list(range(n))
+        self.free_index = list(range(n))
+        self.free_count = n
+        self.score = [0, 0, 0]  # By piece code
+        # Undo stack, two entries per operation: (cell, its position in the free pool) for a move,
+        # (window id, -1) for a strike
+        self.undo = [0] * (4 * n)
+        self.depth = 0
+
+    def reset(self):
+        # Every taken cell sits after 'free_count', so restoring the counter frees them all
+        self.cells[:] = self.blank
+        self.counts[PIECE_O][:] = self.zeros
+        self.counts[PIECE_X][:] = self.zeros
+        self.used_counts[:] = self.zeros
+        self.threats[PIECE_O].clear()
+        self.threats[PIECE_X].clear()
+        self.free_count = len(self.free_cells)
+        self.score[PIECE_O] = self.score[PIECE_X] = 0
+        self.depth = 0
+
+    def update_threat(self, window_id, delta):
+        # A window is a threat when all its cells but one hold pieces of the same player, none of them used
+        if self.used_counts[window_id]:
+            return
+        needed = self.length - 1
+        for player in (PIECE_O, PIECE_X):
+            if self.counts[player][window_id] == needed and not self.counts[3 - player][window_id]:
+                for cell in self.window_cells[window_id]:
+                    if not self.cells[cell]:
+                        threats = self.threats[player]
+                        threats[cell] = threats.get(cell, 0) + delta
+                        if not threats[cell]:
+                            del threats[cell]
+                        return
+
+    def make_move(self, cell, player):
+        window_ids = self.cell_windows[cell]
+        for window_id in window_ids:
+            self.update_threat(window_id, -1)
+        self.cells[cell] = player
+        counts = self.counts[player]
+        for window_id in window_ids:
+            counts[window_id] += 1
+
+        # Take the cell out of the free pool by swapping it with the last free cell
+        free_cells, free_index = self.free_cells, self.free_index
+        i = free_index[cell]
+        last = self.free_count - 1
+        other = free_cells[last]
+        free_cells[i], free_cells[last] = other, cell
+        free_index[other], free_index[cell] = i, last
+        self.free_count = last
+
+        for window_id in window_ids:
+            self.update_threat(window_id, 1)
+        self.undo[self.depth] = cell
+        self.undo[self.depth + 1] = i
+        self.depth += 2
+
+    def strike(self, window_id):
+        # Marks the cells of a completed window as used and returns the winner. A window with a used
+        # cell is never a threat, so threats are only removed, once per window, before its first mark.
+        winner = self.cells[self.window_cells[window_id][0]] & PIECE_MASK
+        for cell in self.window_cells[window_id]:
+            for other_id in self.cell_windows[cell]:
+                if not self.used_counts[other_id]:
+                    self.update_threat(other_id, -1)
+                self.used_counts[other_id] += 1
+            self.cells[cell] |= USED
+        self.score[winner] += 1
+        self.undo[self.depth] = window_id
+        self.undo[self.depth + 1] = -1
+        self.depth += 2
+        return winner
+
+    def unmake_move(self):
+        # Undoes the last move or strike
+        self.depth -= 2
+        value, i = self.undo[self.depth], self.undo[self.depth + 1]
+        if i < 0:
+            window_id = value
+            self.score[self.cells[self.window_cells[window_id][0]] & PIECE_MASK] -= 1
+            for cell in self.window_cells[window_id]:
+                self.cells[cell] &= PIECE_MASK
+                for other_id in self.cell_windows[cell]:
+                    self.used_counts[other_id] -= 1
+                    if not self.used_counts[other_id]:
+                        self.update_threat(other_id, 1)
+            return
+
+        cell = value
+        window_ids = self.cell_windows[cell]
+        for window_id in window_ids:
+            self.update_threat(window_id, -1)
+        counts = self.counts[self.cells[cell]]
+        for window_id in window_ids:
+            counts[window_id] -= 1
+        self.cells[cell] = 0
+
+        # Swap the cell back to where it was in the free pool
+        free_cells, free_index = self.free_cells, self.free_index
+        last = self.free_count
+        other = free_cells[i]
+        free_cells[i], free_cells[last] = cell, other
+        free_index[cell], free_index[other] = i, last
+        self.free_count = last + 1
+
+        for window_id in window_ids:
+            self.update_threat(window_id, 1)
+
+    def winning_window(self, cell):
+        # Only the windows that contain the last placed piece can have been completed by it
+        player = self.cells[cell]
+        if not player or player & USED:
+            return -1
+        counts = self.counts[player]
+        for window_id in self.cell_windows[cell]:
+            if counts[window_id] == self.length and not self.used_counts[window_id]:
+                return window_id
+        return -1
+
+    def random_move(self, player, opponent):
+        if not self.free_count:
+            return -1
+
+        # Check if player can win (first cell in board order, as a full scan would find it)
+        if self.threats[player]:
+            return min(self.threats[player])
+
+        # Check if opponent can win and block
+        if self.threats[opponent]:
+            return min(self.threats[opponent])
+
+        # No immediate win or block, choose random
+        return self.free_cells[random.randrange(self.free_count)]
+
+
+def draw_board(frame, state, margin_x, margin_y, CELL_SIZE):
+    SIZE = state.size
+    for i in range(1, SIZE):
+        # Horizontal lines
+        cv2.line(frame, (margin_x, margin_y + i * CELL_SIZE),
+                 (margin_x + CELL_SIZE * SIZE, margin_y + i * CELL_SIZE), LINE_COLOR, LINE_THICKNESS)
+        # Vertical lines
+        cv2.line(frame, (margin_x + i * CELL_SIZE, margin_y),
+                 (margin_x + i * CELL_SIZE, margin_y + CELL_SIZE * SIZE), LINE_COLOR, LINE_THICKNESS)
+
+    for row in range(SIZE):
+        for col in range(SIZE):
+            center = (margin_x + col * CELL_SIZE + CELL_SIZE // 2,
+                      margin_y + row * CELL_SIZE + CELL_SIZE // 2)
+            flags = state.cells[row * SIZE + col]
+            if flags & PIECE_O:
+                cv2.circle(frame, center, CELL_SIZE // 3, O_COLOR, LINE_THICKNESS)
+            elif flags & PIECE_X:
+                cv2.line(frame, (center[0] - CELL_SIZE // 4, center[1] - CELL_SIZE // 4),
+                         (center[0] + CELL_SIZE // 4, center[1] + CELL_SIZE // 4), X_COLOR, LINE_THICKNESS)
+                cv2.line(frame, (center[0] + CELL_SIZE // 4, center[1] - CELL_SIZE // 4),
+                         (center[0] - CELL_SIZE // 4, center[1] + CELL_SIZE // 4), X_COLOR, LINE_THICKNESS)
+            if flags & USED:
+                cv2.rectangle(frame, (margin_x + col * CELL_SIZE, margin_y + row * CELL_SIZE),
+                              (margin_x + (col + 1) * CELL_SIZE, margin_y + (row + 1) * CELL_SIZE),
+                              (0, 255, 0), 3)
+
+
+def animate_O(frame, center, CELL_SIZE):
+    for i in range(ANIMATION_FRAMES):
+        angle = int(360 * i / ANIMATION_FRAMES)
+        axes = (CELL_SIZE // 3, CELL_SIZE // 3)
+        cv2.ellipse(frame, center, axes, 0, 0, angle, O_COLOR, LINE_THICKNESS)
+        yield frame.copy()
+
+
+def animate_X(frame, center, CELL_SIZE):
+    line_step = CELL_SIZE // (4 * ANIMATION_FRAMES)
+    # Draw the first diagonal
+    for i in range(ANIMATION_FRAMES):
+        cv2.line(frame, (center[0] - line_step * i, center[1] - line_step * i),
+                 (center[0] - CELL_SIZE // 4, center[1] - CELL_SIZE // 4), X_COLOR, LINE_THICKNESS)
+        cv2.line(frame, (center[0] + CELL_SIZE // 4, center[1] + CELL_SIZE // 4),
+                 (center[0] + line_step * i, center[1] + line_step * i), X_COLOR, LINE_THICKNESS)
+        yield frame.copy()
+    # Draw the second diagonal
+    for i in range(ANIMATION_FRAMES):
+        cv2.line(frame, (center[0] + line_step * i, center[1] - line_step * i),
+                 (center[0] + CELL_SIZE // 4, center[1] - CELL_SIZE // 4), X_COLOR, LINE_THICKNESS)
+        cv2.line(frame, (center[0] - CELL_SIZE // 4, center[1] + CELL_SIZE // 4),
+                 (center[0] - line_step * i, center[1] + line_step * i), X_COLOR, LINE_THICKNESS)
+        yield frame.copy()
+
+
+def draw_strike_line(frame, margin_x, margin_y, CELL_SIZE, win_info, color):
+    # Run the line from the outer edge of the first cell to the outer edge of the last one
+    (first_r, first_c), (last_r, last_c) = win_info[0], win_info[-1]
+    dr = (last_r - first_r) // (len(win_info) - 1)
+    dc = (last_c - first_c) // (len(win_info) - 1)
+    start_point = (margin_x + first_c * CELL_SIZE + CELL_SIZE // 2 - dc * CELL_SIZE // 2,
+                   margin_y + first_r * CELL_SIZE + CELL_SIZE // 2 - dr * CELL_SIZE // 2)
+    end_point = (margin_x + last_c * CELL_SIZE + CELL_SIZE // 2 + dc * CELL_SIZE // 2,
+                 margin_y + last_r * CELL_SIZE + CELL_SIZE // 2 + dr * CELL_SIZE // 2)
+
+    cv2.line(frame, start_point, end_point, color, STRIKE_THICKNESS)
+
+
+def draw_text_with_capsule(frame, text, font, font_scale, thickness, position, text_color, capsule_color, capsule_padding=20):
+    text_size = cv2.getTextSize(text, font, font_scale, thickness)[0]
+    text_x, text_y = position
+
+    # Calculate capsule dimensions
+    capsule_width = text_size[0] + capsule_padding * 2
+    capsule_height = text_size[1] + capsule_padding * 2
+    capsule_top_left = (text_x - capsule_padding, text_y - text_size[1] - capsule_padding)
+    capsule_bottom_right = (text_x + text_size[0] + capsule_padding, text_y + capsule_padding)
+
+    # Draw the capsule (rounded rectangle)
+    radius = int(capsule_height / 2)
+    cv2.rectangle(frame, capsule_top_left, capsule_bottom_right, capsule_color, -1, lineType=cv2.LINE_AA)
+    cv2.circle(frame, (capsule_top_left[0] + radius, capsule_top_left[1] + radius), radius, capsule_color, -1, lineType=cv2.LINE_AA)
+    cv2.circle(frame, (capsule_bottom_right[0] - radius, capsule_top_left[1] + radius), radius, capsule_color, -1, lineType=cv2.LINE_AA)
+
+    # Draw the text
+    cv2.putText(frame, text, position, font, font_scale, text_color, thickness, cv2.LINE_AA)
+
+
+def play_game(state):
+    # Plays one game on 'state' and yields what happens, so it can be rendered or just counted:
+    # ('start', state), ('strike', winner, window_id), ('move', player, row, col), ('game_over', score)
+    state.reset()
+    player, opponent = PIECE_O, PIECE_X
+    last_move = -1
+
+    yield 'start', state
+
+    while True:
+        if last_move >= 0:
+            window_id = state.winning_window(last_move)
+            if window_id >= 0:
+                yield 'strike', SYMBOLS[state.strike(window_id)], window_id
+
+        cell = state.random_move(player, opponent)
+        if cell >= 0:
+            state.make_move(cell, player)
+            last_move = cell
+            row, col = divmod(cell, state.size)
+            yield 'move', SYMBOLS[player], row, col
+
+        player, opponent = opponent, player
+
+        # Check if the board is full
+        if not state.free_count:
+            yield 'game_over', {'O': state.score[PIECE_O], 'X': state.score[PIECE_X]}
+            return
+
+
+def record_games(log, state):
+    # Plays games one after another, writing every move, strike and game over to the log as it is yielded
+    records = {'O': RECORD_O, 'X': RECORD_X}
+    while True:
+        for event in play_game(state):
+            if event[0] == 'move':
+                _, player, row, col = event
+                log.write(LOG_RECORD.pack(records[player] | (row * state.size + col)))
+            elif event[0] == 'strike':
+                log.write(LOG_RECORD.pack(RECORD_STRIKE | event[2]))
+            elif event[0] == 'game_over':
+                log.write(LOG_RECORD.pack(RECORD_GAME_OVER))
+            yield event
+
+
+def read_move_log(log_path):
+    # Returns the seed, the board size and the events of a recorded log, in the same form play_game yields them
+    with open(log_path, 'rb') as log:
+        data = log.read()
+    magic, seed, SIZE, length = LOG_HEADER.unpack_from(data)
+    if magic != LOG_MAGIC:
+        raise ValueError(f"{log_path} is not a move log")
+    return seed, SIZE, replay_events(data[LOG_HEADER.size:], GameState(SIZE, length or SIZE))
+
+
+def replay_events(records, state):
+    # Only applies the recorded moves and strikes to the state: no move choice and no win detection
+    state.reset()
+    yield 'start', state
+
+    for (record,) in LOG_RECORD.iter_unpack(records):
+        kind, value = record & RECORD_KIND, record & RECORD_VALUE
+        if kind == RECORD_STRIKE:
+            yield 'strike', SYMBOLS[state.strike(value)], value
+        elif kind == RECORD_GAME_OVER:
+            yield 'game_over', {'O': state.score[PIECE_O], 'X': state.score[PIECE_X]}
+            state.reset()
+            yield 'start', state
+        else:
+            player = PIECE_O if kind == RECORD_O else PIECE_X
+            state.make_move(value, player)
+            row, col = divmod(value, state.size)
+            yield 'move', SYMBOLS[player], row, col
+
+
+def main():
+    if REPLAY_LOG:
+        seed, SIZE, events = read_move_log(REPLAY_LOG)
+        render_games(SIZE, events)
+    else:
+        seed = random.randrange(1 << 32)  # Stored in the log header, so the same games can be played again
+        random.seed(seed)
+        SIZE = random.randint(*BOARD_SIZES)  # Randomize the size of the board at the start
+        # Closed on the way out even when rendering fails, with every record written up to then
+        with open(log_filename, 'wb') as log:
+            log.write(LOG_HEADER.pack(LOG_MAGIC, seed, SIZE, WIN_LENGTH or 0))
+            render_games(SIZE, record_games(log, GameState(SIZE, WIN_LENGTH or SIZE)))
+    cv2.destroyAllWindows()
+
+
+def render_games(SIZE, events):
+    # Renders the events of played or replayed games to the video
+    margin_x, margin_y, CELL_SIZE = calculate_margins_and_cell_size(SIZE)
+
+    out = cv2.VideoWriter(filename, cv2.VideoWriter_fourcc(*'mp4v'), DRAW_FPS, (WIDTH, HEIGHT))
+
+    frame_count = 0
+
+    for event in events:
+        if event[0] == 'start':
+            _, state = event
+            frame = np.ones((HEIGHT, WIDTH, 3), dtype=np.uint8) * 255  # Clear frame
+            draw_board(frame, state, margin_x, margin_y, CELL_SIZE)
+            out.write(frame)
+            frame_count += 1
+
+        elif event[0] == 'strike':
+            _, winner, window_id = event
+            color = O_COLOR if winner == 'O' else X_COLOR
+            draw_strike_line(frame, margin_x, margin_y, CELL_SIZE, state.windows[window_id], color)
+
+            for _ in range(DRAW_FPS):  # Pause briefly to show the strike
+                if frame_count >= TOTAL_FRAMES:
+                    break
+                out.write(frame)
+                frame_count += 1
+
+        elif event[0] == 'move':
+            _, player, row, col = event
+            center = (margin_x + col * CELL_SIZE + CELL_SIZE // 2,
+                      margin_y + row * CELL_SIZE + CELL_SIZE // 2)
+            if player == 'O':
+                for frame in animate_O(frame.copy(), center, CELL_SIZE):
+                    if frame_count >= TOTAL_FRAMES:
+                        break
+                    out.write(frame)
+                    frame_count += 1
+            else:
+                for frame in animate_X(frame.copy(), center, CELL_SIZE):
+                    if frame_count >= TOTAL_FRAMES:
+                        break
+                    out.write(frame)
+                    frame_count += 1
+
+            if frame_count < TOTAL_FRAMES:
+                draw_board(frame, state, margin_x, margin_y, CELL_SIZE)
+                out.write(frame)
+                frame_count += 1
+
+        elif event[0] == 'game_over':
+            _, score = event
+            text = f"Game Over! O: {score['O']} - X: {score['X']}"
+            draw_text_with_capsule(frame, text, FONT, 1.5, 3, ((WIDTH - cv2.getTextSize(text, FONT, 1.5, 3)[0][0]) // 2,
+                                                              (HEIGHT + cv2.getTextSize(text, FONT, 1.5, 3)[0][1]) // 2), LINE_COLOR, (255, 255, 255))
+            for _ in range(DRAW_FPS * 2):  # Pause to show the final score
+                if frame_count >= TOTAL_FRAMES:
+                    break
+                out.write(frame)
+                frame_count += 1
+
+        if frame_count >= TOTAL_FRAMES:
+            break
+
+    out.release()
+
+
+def simulate():
+    # Same games as main(), without drawing or encoding anything
+    for SIZE in SIMULATION_SIZES:
+        if WIN_LENGTH is not None and SIZE < WIN_LENGTH:
+            continue
+        state = GameState(SIZE, WIN_LENGTH or SIZE)
+        total_strikes = total_moves = 0
+        total_score = {'O': 0, 'X': 0}
+        results = {'O': 0, 'X': 0, 'Draw': 0}
+
+        start_time = time.time()
+        for _ in range(SIMULATION_GAMES):
+            for event in play_game(state):
+                if event[0] == 'strike':
+                    total_strikes += 1
+                elif event[0] == 'move':
+                    total_moves += 1
+                elif event[0] == 'game_over':
+                    score = event[1]
+            total_score['O'] += score['O']
+            total_score['X'] += score['X']
+            if score['O'] == score['X']:
+                results['Draw'] += 1
+            else:
+                results['O' if score['O'] > score['X'] else 'X'] += 1
+        elapsed = time.time() - start_time
+
+        games = SIMULATION_GAMES
+        print(f"SIZE {SIZE}: {games / elapsed:.1f} games/s | "
+              f"strikes/game {total_strikes / games:.2f} | moves/game {total_moves / games:.1f} | "
+              f"score O {total_score['O'] / games:.2f} - X {total_score['X'] / games:.2f} | "
+              f"wins O {100 * results['O'] / games:.1f}% X {100 * results['X'] / games:.1f}% "
+              f"draws {100 * results['Draw'] / games:.1f}%")
+
+
+if __name__ == "__main__":
+    if HEADLESS:
+        simulate()
+    else:
+        main()